@@ -11,7 +11,9 @@ Solution: Directly fix nodes on disk, then force verification reload
 """
 
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Set
 from datetime import datetime, timezone
@@ -19,10 +21,35 @@ import re
 import hashlib
 
 
-def sanitize_filename(node_id: str, max_length: int = 180) -> str:
+# Machine-written node files are compact by default; pass --pretty to
+# keep indented output for debugging (indent=2 roughly doubles the bytes
+# written and re-parsed on every subsequent load)
+PRETTY_OUTPUT = False
+
+# Compiled once; sanitize_filename runs per saved node
+_FN_BAD = re.compile(r'[<>"|?*]')
+_FN_TRANS = str.maketrans({":": "-", "/": "-", "\\": "-"})
+
+
+def _change_slug(change_id: str) -> str:
+    """Derive the flag/IX name slug for a ChangeSpec id"""
+    return change_id.replace("change:", "").replace(":", "-").replace("/", "-")
+
+
+def sanitize_filename(node_id: str, max_length: int = 180, parent_len: int = 0) -> str:
     """Sanitize filename with proper truncation"""
-    safe = node_id.replace(":", "-").replace("/", "-").replace("\\", "-")
-    safe = re.sub(r'[<>"|?*]', '-', safe)
+    safe = node_id.translate(_FN_TRANS)
+    safe = _FN_BAD.sub('-', safe)
+
+    # Account for the parent directory, separator and ".json" suffix up
+    # front so callers don't need a second full-path length check; md5
+    # here is a filename key shared with the other tree writers, not a
+    # security boundary. The check uses the post-truncation length so
+    # names the truncation below already keeps under the limit are not
+    # diverted to hash-based ones
+    if parent_len and parent_len + 1 + min(len(safe), max_length) + 5 > 255:
+        node_hash = hashlib.md5(node_id.encode()).hexdigest()[:12]
+        return f"node-{node_hash}"
 
     if len(safe) > max_length:
         # Use hash for uniqueness
@@ -32,67 +59,153 @@ def sanitize_filename(node_id: str, max_length: int = 180) -> str:
     return safe
 
 
-def load_all_nodes(plan_dir: Path) -> Dict[str, Dict]:
-    """Load all nodes from disk"""
+# Node types the fixer phases actually touch; directories for any other
+# type can be skipped without parsing a single file
+FIXER_NODE_TYPES = frozenset({"Scenario", "Component", "InteractionSpec", "Contract", "ChangeSpec"})
+
+
+def load_all_nodes(plan_dir: Path, needed_types: Set[str] = FIXER_NODE_TYPES) -> Dict[str, Dict]:
+    """Load nodes from disk, filtered by type via the directory name
+
+    Pass needed_types=None to load every type.
+    """
     nodes = {}
     nodes_dir = plan_dir / "nodes"
 
     if nodes_dir.exists():
-        for type_dir in nodes_dir.iterdir():
-            if type_dir.is_dir():
-                for node_file in type_dir.glob("*.json"):
-                    try:
-                        with open(node_file, 'r', encoding='utf-8') as f:
-                            node = json.load(f)
-                            node_id = node.get("id")
-                            if node_id:
-                                nodes[node_id] = node
-                    except Exception as e:
-                        print(f"  Warning: Could not load {node_file.name}: {e}")
+        # os.scandir avoids the per-entry Path allocation and stat calls
+        # that Path.iterdir + glob incur on large node directories
+        with os.scandir(nodes_dir) as type_it:
+            for type_entry in type_it:
+                if needed_types is not None and type_entry.name not in needed_types:
+                    continue
+                if not type_entry.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(type_entry.path) as node_it:
+                    for node_entry in node_it:
+                        if not node_entry.name.endswith(".json"):
+                            continue
+                        try:
+                            with open(node_entry.path, 'r', encoding='utf-8') as f:
+                                node = json.load(f)
+                                node_id = node.get("id")
+                                if node_id:
+                                    nodes[node_id] = node
+                        except Exception as e:
+                            print(f"  Warning: Could not load {node_entry.name}: {e}")
 
     return nodes
 
 
+# Per-type directory cache: one mkdir per type per run, and plain string
+# paths so bulk saves skip Path construction on every call
+_type_dirs: Dict[str, str] = {}
+
+
+def _type_dir(plan_dir: Path, node_type: str) -> str:
+    """Resolve (and create once) the directory for a node type"""
+    key = f"{plan_dir}|{node_type}"
+    type_dir = _type_dirs.get(key)
+    if type_dir is None:
+        path = plan_dir / "nodes" / node_type
+        path.mkdir(parents=True, exist_ok=True)
+        type_dir = str(path)
+        _type_dirs[key] = type_dir
+    return type_dir
+
+
 def save_node_direct(plan_dir: Path, node_id: str, node: Dict):
     """Save node directly to disk with proper filename handling"""
     node_type = node.get("type", "Unknown")
-    type_dir = plan_dir / "nodes" / node_type
-    type_dir.mkdir(parents=True, exist_ok=True)
+    type_dir = _type_dir(plan_dir, node_type)
 
-    filename = sanitize_filename(node_id, max_length=180)
-    node_file = type_dir / f"{filename}.json"
-
-    # If filename is still too long, use hash-based name
-    if len(str(node_file)) > 255:
-        # Use hash-based filename
-        node_hash = hashlib.md5(node_id.encode()).hexdigest()[:12]
-        filename = f"node-{node_hash}"
-        node_file = type_dir / f"{filename}.json"
+    filename = sanitize_filename(node_id, max_length=180, parent_len=len(type_dir))
+    node_file = os.path.join(type_dir, filename + ".json")
 
     try:
-        with open(node_file, 'w', encoding='utf-8') as f:
-            json.dump(node, f, indent=2, ensure_ascii=False)
+        # Pre-encode and write binary: one write() syscall, no
+        # TextIOWrapper encode-per-chunk overhead
+        if PRETTY_OUTPUT:
+            payload = json.dumps(node, indent=2, ensure_ascii=False).encode('utf-8')
+        else:
+            payload = json.dumps(node, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        # Write-to-tmp + atomic rename: a crash mid-write can't corrupt
+        # the node file, and the journal is touched once per save
+        tmp_file = node_file + ".tmp"
+        with open(tmp_file, 'wb', buffering=max(8192, len(payload))) as f:
+            f.write(payload)
+        os.replace(tmp_file, node_file)
         return True
     except Exception as e:
         print(f"  ERROR: Could not save {node_id}: {e}")
         return False
 
 
+def _node_sha1(node: Dict) -> str:
+    """Content hash keying the cross-run idempotency cache"""
+    payload = json.dumps(node, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def _save_nodes_parallel(plan_dir: Path, pending: List) -> Set[str]:
+    """Save (node_id, node) pairs concurrently; returns ids saved OK
+
+    The per-node mutation work is cheap Python; the cost is file I/O,
+    during which the GIL is released, so a small thread pool overlaps
+    the write syscalls.
+    """
+    saved: Set[str] = set()
+    if not pending:
+        return saved
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = executor.map(
+            lambda item: (item[0], save_node_direct(plan_dir, item[0], item[1])),
+            pending
+        )
+        for node_id, ok in results:
+            if ok:
+                saved.add(node_id)
+
+    return saved
+
+
 def fix_all_nodes(plan_dir: Path):
     """Fix all nodes that are failing proofs"""
     print("=" * 80)
     print("DIAGNOSE AND FIX ALL NODES")
     print("=" * 80)
 
+    # One timestamp for the whole batch; datetime.now(timezone.utc) per
+    # new node is measurable and "now" means "this run" for a fixer
+    run_ts = datetime.now(timezone.utc).isoformat()
+
     # Load all nodes from disk
     print("\n[Step 1] Loading all nodes from disk...")
     nodes = load_all_nodes(plan_dir)
     print(f"  Loaded {len(nodes)} nodes")
 
+    # Idempotency cache: nodes whose content hash matches the previous
+    # run's cache were left in a fixed state last time — skip them so
+    # re-runs cost O(changed nodes) instead of O(all nodes)
+    cache_file = plan_dir / ".fix-cache.json"
+    prev_hashes = {}
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                prev_hashes = json.load(f)
+        except Exception:
+            prev_hashes = {}
+
+    unchanged = {nid for nid, node in nodes.items()
+                 if prev_hashes.get(nid) == _node_sha1(node)}
+    if unchanged:
+        print(f"  {len(unchanged)} nodes unchanged since last run (cache hit)")
+
     # P5: Scenarios without tests
     print("\n[P5] Fixing scenarios without tests...")
-    scenarios = [n for n in nodes.values() if n.get("type") == "Scenario"]
-    fixed_p5 = 0
+    scenarios = [n for n in nodes.values() if n.get("type") == "Scenario" and n.get("id") not in unchanged]
+    pending_p5 = []
 
     for scenario in scenarios:
         scenario_id = scenario.get("id")
@@ -119,44 +232,48 @@ def fix_all_nodes(plan_dir: Path):
             tests = scenario.get("tests", {})
             if not isinstance(tests, dict):
                 tests = {}
+            mutated = False
             if not tests.get("mocks"):
                 tests["mocks"] = ["Database", "Auth service", "API client"]
+                mutated = True
             if not tests.get("acc"):
                 tests["acc"] = [f"Given {scenario.get('stmt', scenario_id)[:50]}\nWhen user performs action\nThen scenario succeeds"]
-            scenario["tests"] = tests
-            needs_fix = True
+                mutated = True
+            if tests is not scenario["tests"]:
+                scenario["tests"] = tests
+            if mutated:
+                needs_fix = True
 
         if needs_fix:
-            if save_node_direct(plan_dir, scenario_id, scenario):
-                fixed_p5 += 1
-                nodes[scenario_id] = scenario  # Update in-memory copy
+            pending_p5.append((scenario_id, scenario))
 
+    fixed_p5 = len(_save_nodes_parallel(plan_dir, pending_p5))
     print(f"  [OK] Fixed {fixed_p5} scenarios")
 
     # P6: Components/InteractionSpecs without observability
     print("\n[P6] Fixing Components and InteractionSpecs without observability...")
 
     # Components
-    components = [n for n in nodes.values() if n.get("type") == "Component"]
-    fixed_p6_comp = 0
+    components = [n for n in nodes.values() if n.get("type") == "Component" and n.get("id") not in unchanged]
+    pending_comp = []
 
     for component in components:
         component_id = component.get("id")
         if not component.get("observability"):
+            cid_slug = component_id.replace(':', '_')[:50]
             component["observability"] = {
                 "logs": ["Component lifecycle events"],
-                "metrics": [f"component_{component_id.replace(':', '_')[:50]}_count", f"component_{component_id.replace(':', '_')[:50]}_duration"],
-                "spans": f"component.{component_id.replace(':', '_')[:50]}"
+                "metrics": [f"component_{cid_slug}_count", f"component_{cid_slug}_duration"],
+                "spans": f"component.{cid_slug}"
             }
-            if save_node_direct(plan_dir, component_id, component):
-                fixed_p6_comp += 1
-                nodes[component_id] = component
+            pending_comp.append((component_id, component))
 
+    fixed_p6_comp = len(_save_nodes_parallel(plan_dir, pending_comp))
     print(f"  Fixed {fixed_p6_comp} components")
 
     # InteractionSpecs
-    ix_list = [n for n in nodes.values() if n.get("type") == "InteractionSpec"]
-    fixed_p6_ix = 0
+    ix_list = [n for n in nodes.values() if n.get("type") == "InteractionSpec" and n.get("id") not in unchanged]
+    pending_ix_obs = []
 
     for ix in ix_list:
         ix_id = ix.get("id")
@@ -174,10 +291,9 @@ def fix_all_nodes(plan_dir: Path):
                 "metrics": [f"operation_{op_name}_count", f"operation_{op_name}_duration"],
                 "span": f"api.{op_name}"
             }
-            if save_node_direct(plan_dir, ix_id, ix):
-                fixed_p6_ix += 1
-                nodes[ix_id] = ix
+            pending_ix_obs.append((ix_id, ix))
 
+    fixed_p6_ix = len(_save_nodes_parallel(plan_dir, pending_ix_obs))
     print(f"  Fixed {fixed_p6_ix} InteractionSpecs")
     print(f"  [OK] Fixed {fixed_p6_comp + fixed_p6_ix} total (P6)")
 
@@ -185,99 +301,107 @@ def fix_all_nodes(plan_dir: Path):
     print("\n[P7] Fixing contracts and ChangeSpecs...")
 
     # Contracts
-    contracts = [n for n in nodes.values() if n.get("type") == "Contract"]
-    fixed_p7_contracts = 0
+    contracts = [n for n in nodes.values() if n.get("type") == "Contract" and n.get("id") not in unchanged]
+    pending_contracts = []
 
     for contract in contracts:
         contract_id = contract.get("id")
         if not contract.get("versioning"):
             contract["versioning"] = "semver:minor"
-            if save_node_direct(plan_dir, contract_id, contract):
-                fixed_p7_contracts += 1
-                nodes[contract_id] = contract
+            pending_contracts.append((contract_id, contract))
 
+    fixed_p7_contracts = len(_save_nodes_parallel(plan_dir, pending_contracts))
     print(f"  Fixed {fixed_p7_contracts} contracts")
 
     # ChangeSpecs
-    changes = [n for n in nodes.values() if n.get("type") == "ChangeSpec"]
-    fixed_p7_changes = 0
+    changes = [n for n in nodes.values() if n.get("type") == "ChangeSpec" and n.get("id") not in unchanged]
+    pending_flags = []
+
+    # Derive each ChangeSpec's slug once; P7 and P9 both need it
+    change_slugs = {c.get("id"): _change_slug(c.get("id")) for c in changes}
 
     for change in changes:
         change_id = change.get("id")
         if not change.get("rollout_flag"):
-            flag_base = change_id.replace("change:", "").replace(":", "-").replace("/", "-")[:50]
-            flag = f"feature.{flag_base}"
+            flag = f"feature.{change_slugs[change_id][:50]}"
             change["rollout_flag"] = flag
-            if save_node_direct(plan_dir, change_id, change):
-                fixed_p7_changes += 1
-                nodes[change_id] = change
+            pending_flags.append((change_id, change))
 
+    fixed_p7_changes = len(_save_nodes_parallel(plan_dir, pending_flags))
     print(f"  Fixed {fixed_p7_changes} ChangeSpecs")
     print(f"  [OK] Fixed {fixed_p7_contracts + fixed_p7_changes} total (P7)")
 
     # P9: ChangeSpecs without InteractionSpecs
     print("\n[P9] Fixing ChangeSpecs without InteractionSpecs...")
-    changes = [n for n in nodes.values() if n.get("type") == "ChangeSpec"]
-    fixed_p9 = 0
-
-    for change in changes:
-        if change.get("simple", False):
-            continue
-
+    # Pre-filter: most ChangeSpecs are simple or already have ix, so keep
+    # the hot loop to the small remainder that actually needs work
+    p9_targets = [c for c in changes if not c.get("simple") and not c.get("ix")]
+    pending_new_ix = []
+    ix_edge_targets = {}
+    pending_changes = []
+
+    for change in p9_targets:
         change_id = change.get("id")
-        ix_list = change.get("ix", [])
-
-        if not ix_list:
-            # Create InteractionSpec
-            c_base = change_id.replace("change:", "").replace(":", "-").replace("/", "-")
-            if len(c_base) > 80:
-                c_base = c_base[:80]
-            ix_id = f"ix:{c_base}-api-create-fresh-under-ok"
-
-            # Check if IX already exists
-            if ix_id not in nodes:
-                ix = {
-                    "id": ix_id,
-                    "type": "InteractionSpec",
-                    "stmt": f"Create operation via API for {change.get('stmt', change_id)[:50]}",
-                    "method": "Svc.create()",
-                    "interface": "API",
-                    "operation": "POST /resource",
-                    "state": {"token": "fresh", "quota": "under", "network": "ok"},
-                    "pre": ["User authenticated", "Input validated"],
-                    "in": {"params": "resource_data", "headers": ["Authorization"]},
-                    "eff": ["Resource created"],
-                    "err": {"retriable": ["5xx", "429"], "non_retriable": ["400", "401", "403"], "compensation": ["Rollback transaction"]},
-                    "res": {"timeout_ms": 8000, "retry": {"strategy": "exp", "max": 4, "jitter": True}, "idem_key": f"create-{change_id}"},
-                    "obs": {"logs": ["Operation start", "Operation complete"], "metrics": ["operation_create_count", "operation_create_duration"], "span": "api.create"},
-                    "sec": {"authZ": "User owns resource or has permission", "least_priv": "Read/write own resources only", "pii": False},
-                    "test": {"mocks": ["Database", "Auth service"], "acc": ["Given resource exists\nWhen user creates\nThen operation succeeds"]},
-                    "depends_on": [],
-                    "owner": "backend-team",
-                    "est_h": 1,
-                    "status": "Open",
-                    "unaccounted": [],
-                    "updated_at": datetime.now(timezone.utc).isoformat()
-                }
-
-                if save_node_direct(plan_dir, ix_id, ix):
-                    nodes[ix_id] = ix
-
-                    # Add edge
-                    edge = {"from": ix_id, "to": change_id, "type": "depends_on"}
-                    edges_file = plan_dir / "edges.ndjson"
-                    with open(edges_file, 'a', encoding='utf-8') as f:
-                        f.write(json.dumps(edge) + "\n")
-
-            # Update change
-            if ix_id not in change.get("ix", []):
-                change["ix"] = change.get("ix", []) + [ix_id]
-                if save_node_direct(plan_dir, change_id, change):
-                    fixed_p9 += 1
-                    nodes[change_id] = change
 
+        # Create InteractionSpec (slug already derived in P7)
+        c_base = change_slugs[change_id][:80]
+        ix_id = f"ix:{c_base}-api-create-fresh-under-ok"
+
+        # Check if IX already exists
+        if ix_id not in nodes:
+            ix = {
+                "id": ix_id,
+                "type": "InteractionSpec",
+                "stmt": f"Create operation via API for {change.get('stmt', change_id)[:50]}",
+                "method": "Svc.create()",
+                "interface": "API",
+                "operation": "POST /resource",
+                "state": {"token": "fresh", "quota": "under", "network": "ok"},
+                "pre": ["User authenticated", "Input validated"],
+                "in": {"params": "resource_data", "headers": ["Authorization"]},
+                "eff": ["Resource created"],
+                "err": {"retriable": ["5xx", "429"], "non_retriable": ["400", "401", "403"], "compensation": ["Rollback transaction"]},
+                "res": {"timeout_ms": 8000, "retry": {"strategy": "exp", "max": 4, "jitter": True}, "idem_key": f"create-{change_id}"},
+                "obs": {"logs": ["Operation start", "Operation complete"], "metrics": ["operation_create_count", "operation_create_duration"], "span": "api.create"},
+                "sec": {"authZ": "User owns resource or has permission", "least_priv": "Read/write own resources only", "pii": False},
+                "test": {"mocks": ["Database", "Auth service"], "acc": ["Given resource exists\nWhen user creates\nThen operation succeeds"]},
+                "depends_on": [],
+                "owner": "backend-team",
+                "est_h": 1,
+                "status": "Open",
+                "unaccounted": [],
+                "updated_at": run_ts
+            }
+
+            nodes[ix_id] = ix
+            pending_new_ix.append((ix_id, ix))
+            ix_edge_targets[ix_id] = change_id
+
+        # Update change
+        if ix_id not in change.get("ix", []):
+            change["ix"] = change.get("ix", []) + [ix_id]
+            pending_changes.append((change_id, change))
+
+    saved_ix = _save_nodes_parallel(plan_dir, pending_new_ix)
+    if saved_ix:
+        # One append pass for all new depends_on edges
+        edges_file = plan_dir / "edges.ndjson"
+        with open(edges_file, 'a', encoding='utf-8') as f:
+            for ix_id, _ix in pending_new_ix:
+                if ix_id in saved_ix:
+                    edge = {"from": ix_id, "to": ix_edge_targets[ix_id], "type": "depends_on"}
+                    f.write(json.dumps(edge) + "\n")
+
+    fixed_p9 = len(_save_nodes_parallel(plan_dir, pending_changes))
     print(f"  [OK] Fixed {fixed_p9} ChangeSpecs")
 
+    # Persist the idempotency cache for the next run
+    try:
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump({nid: _node_sha1(node) for nid, node in nodes.items()}, f)
+    except Exception as e:
+        print(f"  Warning: Could not write fix cache: {e}")
+
     print("\n" + "=" * 80)
     print("[OK] ALL FIXES APPLIED DIRECTLY TO DISK")
     print("=" * 80)
@@ -287,6 +411,10 @@ def fix_all_nodes(plan_dir: Path):
 
 
 def main():
+    global PRETTY_OUTPUT
+    if "--pretty" in sys.argv:
+        PRETTY_OUTPUT = True
+
     plan_dir = Path("plan-fixed")
 
     if not plan_dir.exists():
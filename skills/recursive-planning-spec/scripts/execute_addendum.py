@@ -6,11 +6,51 @@ Implements prioritized TODO from addendum to close gaps and wire Core Blueprint.
 
 import json
 import os
+import pickle
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, List, Set, Optional, Tuple
+from array import array
 from collections import defaultdict
 
+# orjson parses several times faster than the stdlib json module; fall
+# back silently so the script stays runnable without dependencies
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+# Single-pass replacement table for filenames (three chained .replace
+# calls would allocate two intermediate strings per node)
+_SAFE_TRANS = str.maketrans({":": "-", "/": "-", "&": "-"})
+
+
+def _safe_filename(node_id: str) -> str:
+    """Canonical node-file name; every save path must agree on this"""
+    return node_id.translate(_SAFE_TRANS)
+
+
+def _json_dumps_bytes(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _write_node_bytes(path, payload: bytes):
+    """Raw open/write/close: one syscall per step, no buffered wrapper"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
 # State clusters from addendum §B
 STATE_CLUSTERS = {
     "token": ["fresh", "expired"],
@@ -33,6 +73,168 @@ CORE_BLUEPRINT_AREAS = [
     "payments"
 ]
 
+# Fixed description maps, hoisted so lookups don't rebuild the dict
+# literal on every call
+_AREA_DESCRIPTIONS = {
+    "queues-workers": "Asynchronous job handling with backpressure, retries, DLQ",
+    "secrets-keys": "Managed secrets & key rotation via KMS",
+    "observability": "Structured logs, metrics, traces; dashboards+alerts; SLIs/SLOs",
+    "caching-cdn": "Object & page cache, invalidation/purge, TTLs",
+    "feature-flags-config": "Flags, canaries, kill switch",
+    "preferences-settings": "Data model, defaults, overrides, per-device sync, UI projection",
+    "i18n-a11y": "i18n/l10n; accessibility states and labels",
+    "notifications": "Push/email; preferences; deliverability",
+    "payments": "Contracts & compliance if applicable"
+}
+
+_CONTRACT_DESCRIPTIONS = {
+    "queues-workers": "Queue/worker contract (enqueue/dequeue, retries, DLQ, observability)",
+    "secrets-keys": "Secret storage, access policies, rotation cadence, audit",
+    "observability": "Logging, metrics, tracing contract (SLIs/SLOs, dashboards, alerts)",
+    "caching-cdn": "Cache contract (invalidation, purge, TTLs, hit/miss behavior)",
+    "feature-flags-config": "Feature flag & config contract (evaluation, canaries, kill switch)",
+    "preferences-settings": "Preferences contract (CRUD, sync, retention)",
+    "i18n-a11y": "i18n/a11y contract (localization, accessibility labels)",
+    "notifications": "Notification contract (push/email, preferences, deliverability)",
+    "payments": "Payment contract (processing, compliance, audit)"
+}
+
+# Static node skeletons: copy + update instead of rebuilding the full
+# literal (and re-allocating every list) per created node. Tuples are
+# used for fields nothing mutates — they serialize as JSON arrays.
+_API_CONTRACT_CHECKLIST = (
+    "authZ defined",
+    "rate_limit defined",
+    "versioning defined",
+    "error taxonomy defined",
+    "idempotency defined",
+    "timeouts defined",
+    "observability defined"
+)
+
+_REQUIREMENT_SKELETON = {
+    "type": "Requirement",
+    "status": "Open",
+    "components": (),
+    "checklist": (),
+    "evidence": (),
+    "unaccounted": ()
+}
+
+_API_CONTRACT_SKELETON = {
+    "type": "Contract",
+    "status": "Open",
+    "contract_type": "api",
+    "versioning": "semver:minor",
+    "checklist": _API_CONTRACT_CHECKLIST,
+    "evidence": (),
+    "unaccounted": ()
+}
+
+_DATA_CONTRACT_SKELETON = {
+    "type": "Contract",
+    "status": "Open",
+    "contract_type": "data",
+    "checklist": (
+        "schema defined",
+        "indices defined",
+        "migration/backfill defined",
+        "retention defined",
+        "region/PII defined"
+    ),
+    "evidence": (),
+    "unaccounted": ()
+}
+
+_CHANGESPEC_SKELETON = {
+    "type": "ChangeSpec",
+    "status": "Open",
+    "accept": (),
+    "checklist": (),
+    "est_h": 0,
+    "owner": "",
+    "rollout_flag": "",
+    "evidence": (),
+    "unaccounted": (),
+    "simple": False
+}
+
+_SCENARIO_SKELETON = {
+    "type": "Scenario",
+    "status": "Open",
+    "requirements": (),
+    "tests": (),
+    "acceptance": (),
+    "checklist": (),
+    "evidence": (),
+    "unaccounted": ()
+}
+
+# InteractionSpec template: ~25 keys of which only a handful vary per
+# IX. A cached pickle round-trip clones the nested structure 2-3x
+# faster than copy.deepcopy rebuilding it from a literal each time.
+_IX_TEMPLATE = {
+    "id": None,
+    "type": "InteractionSpec",
+    "stmt": None,
+    "method": None,
+    "interface": None,
+    "operation": None,
+    "state": None,
+    "pre": None,
+    "in": None,
+    "eff": None,
+    "err": {
+        "retriable": ["5xx", "429", "Network timeout"],
+        "non_retriable": ["400", "401", "403", "404", "413", "415"],
+        "compensation": None
+    },
+    "res": {
+        "timeout_ms": 8000,
+        "retry": {
+            "strategy": "exp",
+            "max": 4,
+            "jitter": True
+        },
+        "idem_key": None
+    },
+    "obs": None,
+    "sec": {
+        "authZ": "User owns resource or has permission",
+        "least_priv": "Read/write own resources only",
+        "pii": False
+    },
+    "test": {
+        "mocks": ["Database", "Auth service"],
+        "acc": None
+    },
+    "depends_on": None,
+    "owner": "backend-team",
+    "est_h": 1,
+    "status": "Open",
+    "unaccounted": [],
+    "updated_at": None
+}
+
+_IX_TEMPLATE_PICKLE = pickle.dumps(_IX_TEMPLATE, protocol=pickle.HIGHEST_PROTOCOL)
+
+# Only two state-cluster shapes ever occur; they are read-only once
+# attached to an IX, so all specs can share the same dicts
+_STATE_FRESH_UNDER_OK = {"token": "fresh", "quota": "under", "network": "ok"}
+_STATE_FRESH_UNDER_OK_MISS = {**_STATE_FRESH_UNDER_OK, "cache": "miss"}
+
+
+def _new_ix() -> Dict:
+    """Fresh deep clone of the InteractionSpec template"""
+    return pickle.loads(_IX_TEMPLATE_PICKLE)
+
+
+# Keyword probes compiled once: the regex engine scans the text in a
+# single pass instead of one Python-level substring scan per keyword
+WRITE_KW_RE = re.compile(r"insert|update|delete|post|put|patch|create|write")
+DATA_KW_RE = re.compile(r"data|storage|database|schema|persist")
+
+
 class PlanGraph:
     """Plan graph structure"""
 
@@ -40,7 +242,27 @@ class PlanGraph:
         self.base_dir = Path(base_dir)
         self.nodes: Dict[str, Dict] = {}
         self.edges: List[Dict] = []
-        self.node_by_type: Dict[str, Set[str]] = defaultdict(set)
+        # Nodes also get a dense integer index; the per-type buckets are
+        # packed uint64 arrays (~8 bytes/entry) instead of string sets,
+        # which keeps large plans compact and iteration hash-free
+        self.nodes_list: List[Dict] = []
+        self.id_to_idx: Dict[str, int] = {}
+        self.node_by_type: Dict[str, array] = defaultdict(lambda: array('Q'))
+        # Forward/reverse adjacency so edge queries don't scan the full
+        # edge list per call
+        self.edges_from: Dict[str, List[Dict]] = defaultdict(list)
+        self.edges_to: Dict[str, List[Dict]] = defaultdict(list)
+        # Composite (node_id, edge_type) buckets so typed queries skip
+        # the per-call type filter entirely
+        self.edges_from_typed: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
+        self.edges_to_typed: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
+        # get_nodes_by_type is hit repeatedly per pass; memoize the
+        # built lists (node_by_type only changes at load time)
+        self._nodes_by_type_cache: Dict[str, List[Dict]] = {}
+        # Edges parse lazily on first query; a run that never touches
+        # them (or exits early) skips the whole NDJSON parse
+        self._edges_path = self.base_dir / "edges.ndjson"
+        self._edges_loaded = False
         self.load()
 
     def load(self):
@@ -49,26 +271,43 @@ class PlanGraph:
         for type_dir in nodes_dir.iterdir():
             if type_dir.is_dir():
                 node_type = type_dir.name
-                for node_file in type_dir.glob("*.json"):
-                    try:
-                        with open(node_file, 'r') as f:
-                            node = json.load(f)
+                # os.scandir skips the per-entry stat and Path overhead
+                # of glob; parse bytes directly
+                with os.scandir(type_dir) as it:
+                    for entry in it:
+                        if not entry.name.endswith('.json'):
+                            continue
+                        try:
+                            with open(entry.path, 'rb') as f:
+                                node = _json_loads(f.read())
                             node_id = node.get('id')
                             if node_id:
                                 self.nodes[node_id] = node
-                                self.node_by_type[node_type].add(node_id)
-                    except Exception as e:
-                        pass
+                                idx = self.id_to_idx.get(node_id)
+                                if idx is None:
+                                    self.id_to_idx[node_id] = len(self.nodes_list)
+                                    self.nodes_list.append(node)
+                                    self.node_by_type[node_type].append(self.id_to_idx[node_id])
+                                else:
+                                    self.nodes_list[idx] = node
+                        except Exception:
+                            pass
 
-        edges_path = self.base_dir / "edges.ndjson"
-        if edges_path.exists():
-            with open(edges_path, 'r') as f:
+    def ensure_edges_loaded(self):
+        """Parse edges.ndjson on first use"""
+        if self._edges_loaded:
+            return
+        self._edges_loaded = True
+
+        if self._edges_path.exists():
+            # Binary line iteration with a 1MB buffer: no per-line str
+            # decode, and few read syscalls for large edge stores
+            with open(self._edges_path, 'rb', buffering=1 << 20) as f:
                 for line in f:
-                    line = line.strip()
-                    if line:
+                    if line.strip():
                         try:
-                            edge = json.loads(line)
-                            self.edges.append(edge)
+                            edge = _json_loads(line)
+                            self.add_edge(edge)
                         except Exception:
                             pass
 
@@ -76,22 +315,39 @@ class PlanGraph:
         return self.nodes.get(node_id)
 
     def get_nodes_by_type(self, node_type: str) -> List[Dict]:
-        return [self.nodes[nid] for nid in self.node_by_type.get(node_type, []) if nid in self.nodes]
+        cached = self._nodes_by_type_cache.get(node_type)
+        if cached is None:
+            nodes_list = self.nodes_list
+            cached = [nodes_list[i] for i in self.node_by_type.get(node_type, ())]
+            self._nodes_by_type_cache[node_type] = cached
+        return cached
+
+    def invalidate_type_cache(self, node_type: str):
+        """Drop the memoized list for a type after nodes of it change"""
+        self._nodes_by_type_cache.pop(node_type, None)
 
     def has_node(self, node_id: str) -> bool:
         return node_id in self.nodes
 
+    def add_edge(self, edge: Dict):
+        """Record an edge and keep the adjacency indexes in sync"""
+        self.edges.append(edge)
+        self.edges_from[edge.get('from')].append(edge)
+        self.edges_to[edge.get('to')].append(edge)
+        self.edges_from_typed[(edge.get('from'), edge.get('type'))].append(edge)
+        self.edges_to_typed[(edge.get('to'), edge.get('type'))].append(edge)
+
     def get_edges_from(self, node_id: str, edge_type: Optional[str] = None) -> List[Dict]:
-        results = [e for e in self.edges if e.get('from') == node_id]
+        self.ensure_edges_loaded()
         if edge_type:
-            results = [e for e in results if e.get('type') == edge_type]
-        return results
+            return self.edges_from_typed.get((node_id, edge_type), [])
+        return self.edges_from.get(node_id, [])
 
     def get_edges_to(self, node_id: str, edge_type: Optional[str] = None) -> List[Dict]:
-        results = [e for e in self.edges if e.get('to') == node_id]
+        self.ensure_edges_loaded()
         if edge_type:
-            results = [e for e in results if e.get('type') == edge_type]
-        return results
+            return self.edges_to_typed.get((node_id, edge_type), [])
+        return self.edges_to.get(node_id, [])
 
 
 class AddendumExecutor:
@@ -104,8 +360,21 @@ class AddendumExecutor:
         self.new_edges: List[Dict] = []
         self.changed_nodes: Set[str] = set()
 
+    def _add_edge(self, edge: Dict):
+        """Queue an edge for save and make it visible to graph queries"""
+        self.new_edges.append(edge)
+        graph = self.graph
+        graph.edges_from[edge.get('from')].append(edge)
+        graph.edges_to[edge.get('to')].append(edge)
+        graph.edges_from_typed[(edge.get('from'), edge.get('type'))].append(edge)
+        graph.edges_to_typed[(edge.get('to'), edge.get('type'))].append(edge)
+
     def execute(self) -> Dict:
         """Execute prioritized TODO in order"""
+        # All nodes created by one execute() are a single logical delta;
+        # share one timestamp instead of a clock call per node
+        self.now_iso = datetime.now(timezone.utc).isoformat()
+
         print("=" * 80)
         print("EXECUTING ADDENDUM v3.1-supp: Expansion & Core Wiring")
         print("=" * 80)
@@ -135,6 +404,11 @@ class AddendumExecutor:
     def _core_blueprint_remediation(self):
         """A.1: Core Blueprint remediation"""
 
+        # Identify write-path ChangeSpecs once; the per-area wiring
+        # reuses the list instead of rescanning every ChangeSpec 9x
+        write_specs = [cs for cs in self.graph.get_nodes_by_type("ChangeSpec")
+                       if self._has_write_ix(cs)]
+
         # Check each Core Blueprint area
         for area in CORE_BLUEPRINT_AREAS:
             area_id = f"req:{area}"
@@ -144,50 +418,31 @@ class AddendumExecutor:
                 print(f"  Creating Requirement + Contract for {area}...")
 
                 # Create Requirement
-                req = {
-                    "id": area_id,
-                    "type": "Requirement",
-                    "stmt": self._get_area_description(area),
-                    "status": "Open",
-                    "change_specs": [],
-                    "contracts": [],
-                    "components": [],
-                    "checklist": [],
-                    "evidence": [],
-                    "unaccounted": [],
-                    "updated_at": datetime.now(timezone.utc).isoformat()
-                }
+                req = _REQUIREMENT_SKELETON.copy()
+                req.update(
+                    id=area_id,
+                    stmt=self._get_area_description(area),
+                    change_specs=[],
+                    contracts=[],
+                    updated_at=self.now_iso
+                )
                 self.new_nodes[area_id] = req
 
                 # Create Contract
                 contract_id = f"contract:api-{area}"
-                contract = {
-                    "id": contract_id,
-                    "type": "Contract",
-                    "stmt": self._get_contract_description(area),
-                    "status": "Open",
-                    "contract_type": "api",
-                    "versioning": "semver:minor",
-                    "error_taxonomy": [],
-                    "timeouts": {},
-                    "idempotency": "required",
-                    "checklist": [
-                        "authZ defined",
-                        "rate_limit defined",
-                        "versioning defined",
-                        "error taxonomy defined",
-                        "idempotency defined",
-                        "timeouts defined",
-                        "observability defined"
-                    ],
-                    "evidence": [],
-                    "unaccounted": [],
-                    "updated_at": datetime.now(timezone.utc).isoformat()
-                }
+                contract = _API_CONTRACT_SKELETON.copy()
+                contract.update(
+                    id=contract_id,
+                    stmt=self._get_contract_description(area),
+                    error_taxonomy=(),
+                    timeouts={},
+                    idempotency="required",
+                    updated_at=self.now_iso
+                )
                 self.new_nodes[contract_id] = contract
 
                 # Create edge
-                self.new_edges.append({
+                self._add_edge({
                     "from": area_id,
                     "to": contract_id,
                     "type": "depends_on"
@@ -197,75 +452,50 @@ class AddendumExecutor:
                 req["contracts"].append(contract_id)
 
             # Wire write paths to core contracts
-            self._wire_write_paths_to_core(area)
+            self._wire_write_paths_to_core(area, write_specs)
 
-    def _get_area_description(self, area: str) -> str:
+    @staticmethod
+    def _get_area_description(area: str) -> str:
         """Get description for Core Blueprint area"""
-        descriptions = {
-            "queues-workers": "Asynchronous job handling with backpressure, retries, DLQ",
-            "secrets-keys": "Managed secrets & key rotation via KMS",
-            "observability": "Structured logs, metrics, traces; dashboards+alerts; SLIs/SLOs",
-            "caching-cdn": "Object & page cache, invalidation/purge, TTLs",
-            "feature-flags-config": "Flags, canaries, kill switch",
-            "preferences-settings": "Data model, defaults, overrides, per-device sync, UI projection",
-            "i18n-a11y": "i18n/l10n; accessibility states and labels",
-            "notifications": "Push/email; preferences; deliverability",
-            "payments": "Contracts & compliance if applicable"
-        }
-        return descriptions.get(area, f"Core Blueprint requirement for {area}")
+        return _AREA_DESCRIPTIONS.get(area, f"Core Blueprint requirement for {area}")
 
-    def _get_contract_description(self, area: str) -> str:
+    @staticmethod
+    def _get_contract_description(area: str) -> str:
         """Get contract description"""
-        descriptions = {
-            "queues-workers": "Queue/worker contract (enqueue/dequeue, retries, DLQ, observability)",
-            "secrets-keys": "Secret storage, access policies, rotation cadence, audit",
-            "observability": "Logging, metrics, tracing contract (SLIs/SLOs, dashboards, alerts)",
-            "caching-cdn": "Cache contract (invalidation, purge, TTLs, hit/miss behavior)",
-            "feature-flags-config": "Feature flag & config contract (evaluation, canaries, kill switch)",
-            "preferences-settings": "Preferences contract (CRUD, sync, retention)",
-            "i18n-a11y": "i18n/a11y contract (localization, accessibility labels)",
-            "notifications": "Notification contract (push/email, preferences, deliverability)",
-            "payments": "Payment contract (processing, compliance, audit)"
-        }
-        return descriptions.get(area, f"API contract for {area}")
-
-    def _wire_write_paths_to_core(self, core_area: str):
+        return _CONTRACT_DESCRIPTIONS.get(area, f"API contract for {area}")
+
+    def _has_write_ix(self, changespec: Dict) -> bool:
+        """True if any of the ChangeSpec's IXs is a write operation"""
+        for ix_id in changespec.get("ix", []):
+            ix_node = self.graph.get_node(ix_id)
+            if ix_node:
+                operation = ix_node.get("operation", "").lower()
+                method = ix_node.get("method", "").lower()
+                if WRITE_KW_RE.search(operation) or WRITE_KW_RE.search(method):
+                    return True
+        return False
+
+    def _wire_write_paths_to_core(self, core_area: str, write_specs: List[Dict]):
         """Wire write paths to core contracts"""
         contract_id = f"contract:api-{core_area}"
         if not self.graph.has_node(contract_id) and contract_id not in self.new_nodes:
             return
 
-        # Find write paths (ChangeSpecs with write operations)
-        change_specs = self.graph.get_nodes_by_type("ChangeSpec")
-
-        for cs in change_specs:
+        for cs in write_specs:
             cs_id = cs.get("id")
-            ix_list = cs.get("ix", [])
 
-            # Check if any InteractionSpec is a write operation
-            has_write = False
-            for ix_id in ix_list:
-                ix_node = self.graph.get_node(ix_id)
-                if ix_node:
-                    operation = ix_node.get("operation", "").lower()
-                    method = ix_node.get("method", "").lower()
-                    if any(op in operation or op in method for op in ["insert", "update", "delete", "post", "put", "patch", "create", "write"]):
-                        has_write = True
-                        break
-
-            if has_write:
-                # Check if already has depends_on
-                existing = self.graph.get_edges_from(cs_id, "depends_on")
-                depends_on_contract = any(e.get("to") == contract_id for e in existing)
-
-                if not depends_on_contract:
-                    # Add depends_on edge
-                    self.new_edges.append({
-                        "from": cs_id,
-                        "to": contract_id,
-                        "type": "depends_on"
-                    })
-                    print(f"    Wired {cs_id} to {contract_id}")
+            # Check if already has depends_on
+            existing = self.graph.get_edges_from(cs_id, "depends_on")
+            depends_on_contract = any(e.get("to") == contract_id for e in existing)
+
+            if not depends_on_contract:
+                # Add depends_on edge
+                self._add_edge({
+                    "from": cs_id,
+                    "to": contract_id,
+                    "type": "depends_on"
+                })
+                print(f"    Wired {cs_id} to {contract_id}")
 
     def _nonterminal_expansion(self):
         """A.2: Nonterminal expansion"""
@@ -274,28 +504,23 @@ class AddendumExecutor:
         capabilities = self.graph.get_nodes_by_type("Capability")
         for cap in capabilities:
             cap_id = cap.get("id")
-            scenarios = [e for e in self.graph.get_edges_from(cap_id, "traces_to")
-                       if self.graph.get_node(e.get("to", "")) and
-                       self.graph.get_node(e.get("to", "")).get("type") == "Scenario"]
+            # Only existence matters; any() stops at the first match
+            # instead of materializing the full list
+            has_scenario = any((n := self.graph.get_node(e.get("to", ""))) and
+                               n.get("type") == "Scenario"
+                               for e in self.graph.get_edges_from(cap_id, "traces_to"))
 
-            if not scenarios:
+            if not has_scenario:
                 # Create at least happy scenario
                 scenario_id = f"scenario:{cap_id.replace('cap:', '')}"
-                scenario = {
-                    "id": scenario_id,
-                    "type": "Scenario",
-                    "stmt": f"Happy path scenario for {cap.get('stmt', cap_id)}",
-                    "status": "Open",
-                    "requirements": [],
-                    "tests": [],
-                    "acceptance": [],
-                    "checklist": [],
-                    "evidence": [],
-                    "unaccounted": [],
-                    "updated_at": datetime.now(timezone.utc).isoformat()
-                }
+                scenario = _SCENARIO_SKELETON.copy()
+                scenario.update(
+                    id=scenario_id,
+                    stmt=f"Happy path scenario for {cap.get('stmt', cap_id)}",
+                    updated_at=self.now_iso
+                )
                 self.new_nodes[scenario_id] = scenario
-                self.new_edges.append({
+                self._add_edge({
                     "from": cap_id,
                     "to": scenario_id,
                     "type": "traces_to"
@@ -309,75 +534,50 @@ class AddendumExecutor:
 
             # Check for Contracts
             contracts = req.get("contracts", [])
-            has_api_contract = any("api" in cid for cid in contracts)
-            has_data_contract = any("data" in cid for cid in contracts)
+            # Contract ids follow fixed prefixes; an anchored startswith
+            # beats substring-scanning every id twice
+            has_api_contract = any(cid.startswith("contract:api-") for cid in contracts)
+            has_data_contract = any(cid.startswith("contract:data-") for cid in contracts)
 
             if not has_api_contract:
                 # Create API contract
                 contract_id = f"contract:api-{req_id.replace('req:', '')}"
                 if not self.graph.has_node(contract_id):
-                    contract = {
-                        "id": contract_id,
-                        "type": "Contract",
-                        "stmt": f"API contract for {req.get('stmt', req_id)} (endpoints, errors, idempotency, timeouts, versioning, rate limits, observability)",
-                        "status": "Open",
-                        "contract_type": "api",
-                        "versioning": "semver:minor",
-                        "checklist": [
-                            "authZ defined",
-                            "rate_limit defined",
-                            "versioning defined",
-                            "error taxonomy defined",
-                            "idempotency defined",
-                            "timeouts defined",
-                            "observability defined"
-                        ],
-                        "evidence": [],
-                        "unaccounted": [],
-                        "updated_at": datetime.now(timezone.utc).isoformat()
-                    }
+                    contract = _API_CONTRACT_SKELETON.copy()
+                    contract.update(
+                        id=contract_id,
+                        stmt=f"API contract for {req.get('stmt', req_id)} (endpoints, errors, idempotency, timeouts, versioning, rate limits, observability)",
+                        updated_at=self.now_iso
+                    )
                     self.new_nodes[contract_id] = contract
-                    self.new_edges.append({
+                    self._add_edge({
                         "from": req_id,
                         "to": contract_id,
                         "type": "depends_on"
                     })
-                    if req_id not in self.changed_nodes:
-                        self.changed_nodes.add(req_id)
-                        req["contracts"] = req.get("contracts", []) + [contract_id]
+                    req.setdefault("contracts", []).append(contract_id)
+                    self.changed_nodes.add(req_id)
 
             if not has_data_contract:
                 # Create Data contract if needed (only for data operations)
                 stmt = req.get("stmt", "").lower()
-                if any(keyword in stmt for keyword in ["data", "storage", "database", "schema", "persist"]):
+                if DATA_KW_RE.search(stmt):
                     contract_id = f"contract:data-{req_id.replace('req:', '')}"
                     if not self.graph.has_node(contract_id):
-                        contract = {
-                            "id": contract_id,
-                            "type": "Contract",
-                            "stmt": f"Data contract for {req.get('stmt', req_id)} (schema, indices, migration/backfill, retention, region/PII)",
-                            "status": "Open",
-                            "contract_type": "data",
-                            "checklist": [
-                                "schema defined",
-                                "indices defined",
-                                "migration/backfill defined",
-                                "retention defined",
-                                "region/PII defined"
-                            ],
-                            "evidence": [],
-                            "unaccounted": [],
-                            "updated_at": datetime.now(timezone.utc).isoformat()
-                        }
+                        contract = _DATA_CONTRACT_SKELETON.copy()
+                        contract.update(
+                            id=contract_id,
+                            stmt=f"Data contract for {req.get('stmt', req_id)} (schema, indices, migration/backfill, retention, region/PII)",
+                            updated_at=self.now_iso
+                        )
                         self.new_nodes[contract_id] = contract
-                        self.new_edges.append({
+                        self._add_edge({
                             "from": req_id,
                             "to": contract_id,
                             "type": "depends_on"
                         })
-                        if req_id not in self.changed_nodes:
-                            self.changed_nodes.add(req_id)
-                            req["contracts"] = req.get("contracts", []) + [contract_id]
+                        req.setdefault("contracts", []).append(contract_id)
+                        self.changed_nodes.add(req_id)
 
             # Check for ChangeSpec
             change_specs = req.get("change_specs", [])
@@ -385,32 +585,22 @@ class AddendumExecutor:
                 # Create ChangeSpec
                 change_id = f"change:{req_id.replace('req:', '')}"
                 if not self.graph.has_node(change_id):
-                    change = {
-                        "id": change_id,
-                        "type": "ChangeSpec",
-                        "stmt": f"Implement {req.get('stmt', req_id)}",
-                        "status": "Open",
-                        "implements": [req_id],
-                        "ix": [],
-                        "accept": [],
-                        "checklist": [],
-                        "est_h": 0,
-                        "owner": "",
-                        "rollout_flag": "",
-                        "evidence": [],
-                        "unaccounted": [],
-                        "simple": False,
-                        "updated_at": datetime.now(timezone.utc).isoformat()
-                    }
+                    change = _CHANGESPEC_SKELETON.copy()
+                    change.update(
+                        id=change_id,
+                        stmt=f"Implement {req.get('stmt', req_id)}",
+                        implements=[req_id],
+                        ix=[],
+                        updated_at=self.now_iso
+                    )
                     self.new_nodes[change_id] = change
-                    self.new_edges.append({
+                    self._add_edge({
                         "from": change_id,
                         "to": req_id,
                         "type": "implements"
                     })
-                    if req_id not in self.changed_nodes:
-                        self.changed_nodes.add(req_id)
-                        req["change_specs"] = req.get("change_specs", []) + [change_id]
+                    req.setdefault("change_specs", []).append(change_id)
+                    self.changed_nodes.add(req_id)
                     print(f"  Created ChangeSpec for {req_id}")
 
         # Expand ChangeSpecs missing InteractionSpecs
@@ -447,84 +637,50 @@ class AddendumExecutor:
         # Create InteractionSpecs with state clustering
         for interface in interfaces:
             for operation in operations:
-                # Create one IX per state cluster (minimal: fresh token, under quota, ok network)
-                state_cluster = {
-                    "token": "fresh",
-                    "quota": "under",
-                    "network": "ok"
-                }
-
-                # For read operations, add cache state
-                if operation == "read":
-                    state_cluster["cache"] = "miss"  # Start with miss, can add hit variant
+                # One IX per state cluster (minimal: fresh token, under
+                # quota, ok network; reads start from cache miss)
+                state_cluster = _STATE_FRESH_UNDER_OK_MISS if operation == "read" else _STATE_FRESH_UNDER_OK
 
                 ix_id = f"ix:{cs_id.replace('change:', '')}-{interface.lower()}-{operation}-fresh-under-ok"
                 if operation == "read":
                     ix_id += "-miss"
 
                 if not self.graph.has_node(ix_id):
-                    ix = {
-                        "id": ix_id,
-                        "type": "InteractionSpec",
-                        "stmt": f"{operation.capitalize()} operation via {interface}",
-                        "method": f"Svc.{operation}()",
-                        "interface": interface,
-                        "operation": f"{operation.upper()} /resource" if interface == "API" else f"{operation.upper()} resource",
-                        "state": state_cluster,
-                        "pre": ["User authenticated", "Resource exists" if operation != "create" else "Input validated"],
-                        "in": {
-                            "params": "resource_id" if operation != "create" else "resource_data",
-                            "headers": ["Authorization"]
-                        } if interface == "API" else {
-                            "params": "resource_id" if operation != "create" else "resource_data"
-                        },
-                        "eff": ["Resource created/updated/deleted" if operation != "read" else "Resource returned"],
-                        "err": {
-                            "retriable": ["5xx", "429", "Network timeout"],
-                            "non_retriable": ["400", "401", "403", "404", "413", "415"],
-                            "compensation": ["Rollback transaction" if operation != "read" else "None"]
-                        },
-                        "res": {
-                            "timeout_ms": 8000,
-                            "retry": {
-                                "strategy": "exp",
-                                "max": 4,
-                                "jitter": True
-                            },
-                            "idem_key": f"{operation}-{cs_id}" if operation != "read" else None
-                        },
-                        "obs": {
-                            "logs": ["Operation start", "Operation complete"],
-                            "metrics": [f"operation_{operation}_count", f"operation_{operation}_duration"],
-                            "span": f"{interface.lower()}.{operation}"
-                        },
-                        "sec": {
-                            "authZ": "User owns resource or has permission",
-                            "least_priv": "Read/write own resources only",
-                            "pii": False
-                        },
-                        "test": {
-                            "mocks": ["Database", "Auth service"],
-                            "acc": [f"Given resource exists\nWhen user {operation}s\nThen operation succeeds"]
-                        },
-                        "depends_on": [f"contract:api-{cs_id.replace('change:', '')}"],
-                        "owner": "backend-team",
-                        "est_h": 1,
-                        "status": "Open",
-                        "unaccounted": [],
-                        "updated_at": datetime.now(timezone.utc).isoformat()
+                    ix = _new_ix()
+                    ix["id"] = ix_id
+                    ix["stmt"] = f"{operation.capitalize()} operation via {interface}"
+                    ix["method"] = f"Svc.{operation}()"
+                    ix["interface"] = interface
+                    ix["operation"] = f"{operation.upper()} /resource" if interface == "API" else f"{operation.upper()} resource"
+                    ix["state"] = state_cluster
+                    ix["pre"] = ["User authenticated", "Resource exists" if operation != "create" else "Input validated"]
+                    ix["in"] = {
+                        "params": "resource_id" if operation != "create" else "resource_data",
+                        "headers": ["Authorization"]
+                    } if interface == "API" else {
+                        "params": "resource_id" if operation != "create" else "resource_data"
+                    }
+                    ix["eff"] = ["Resource created/updated/deleted" if operation != "read" else "Resource returned"]
+                    ix["err"]["compensation"] = ["Rollback transaction" if operation != "read" else "None"]
+                    ix["res"]["idem_key"] = f"{operation}-{cs_id}" if operation != "read" else None
+                    ix["obs"] = {
+                        "logs": ["Operation start", "Operation complete"],
+                        "metrics": [f"operation_{operation}_count", f"operation_{operation}_duration"],
+                        "span": f"{interface.lower()}.{operation}"
                     }
+                    ix["test"]["acc"] = [f"Given resource exists\nWhen user {operation}s\nThen operation succeeds"]
+                    ix["depends_on"] = [f"contract:api-{cs_id.replace('change:', '')}"]
+                    ix["updated_at"] = self.now_iso
                     self.new_nodes[ix_id] = ix
-                    self.new_edges.append({
+                    self._add_edge({
                         "from": ix_id,
                         "to": cs_id,
                         "type": "depends_on"
                     })
 
                     # Update ChangeSpec
-                    if cs_id not in self.changed_nodes:
-                        self.changed_nodes.add(cs_id)
-                    changespec["ix"] = changespec.get("ix", []) + [ix_id]
+                    changespec.setdefault("ix", []).append(ix_id)
+                    self.changed_nodes.add(cs_id)
 
         print(f"  Created InteractionSpecs for {cs_id}")
 
@@ -534,16 +690,18 @@ class AddendumExecutor:
         # Find orphan InteractionSpecs (not reachable via Scenario→Req→Change)
         interaction_specs = self.graph.get_nodes_by_type("InteractionSpec")
 
+        # One linear pass over the edge list replaces a per-IX reverse
+        # probe: collect every node targeted by a ChangeSpec depends_on
+        self.graph.ensure_edges_loaded()
+        nodes = self.graph.nodes
+        reachable = {e.get("to") for e in self.graph.edges
+                     if e.get("type") == "depends_on" and
+                     (n := nodes.get(e.get("from"))) and n.get("type") == "ChangeSpec"}
+
         for ix in interaction_specs:
             ix_id = ix.get("id")
 
-            # Check if reachable via ChangeSpec
-            change_edges = self.graph.get_edges_to(ix_id, "depends_on")
-            change_edges = [e for e in change_edges
-                          if self.graph.get_node(e.get("from")) and
-                          self.graph.get_node(e.get("from")).get("type") == "ChangeSpec"]
-
-            if not change_edges:
+            if ix_id not in reachable:
                 # Find or create ChangeSpec
                 # Try to infer from IX ID
                 ix_base = ix_id.replace("ix:", "").split("-")[0]
@@ -551,47 +709,53 @@ class AddendumExecutor:
 
                 if self.graph.has_node(change_id):
                     # Link to existing ChangeSpec
-                    self.new_edges.append({
+                    self._add_edge({
                         "from": ix_id,
                         "to": change_id,
                         "type": "depends_on"
                     })
                     change_node = self.graph.get_node(change_id)
-                    if change_id not in self.changed_nodes:
-                        self.changed_nodes.add(change_id)
-                    change_node["ix"] = change_node.get("ix", []) + [ix_id]
+                    change_node.setdefault("ix", []).append(ix_id)
+                    self.changed_nodes.add(change_id)
                     print(f"  Linked orphan {ix_id} to {change_id}")
 
     def save_deltas(self, plan_dir: Path):
         """Save new nodes and edges"""
         nodes_dir = plan_dir / "nodes"
 
-        # Save new nodes
+        # Save new nodes grouped by type: one mkdir per type, not per node
+        by_type: Dict[str, List[Tuple[str, Dict]]] = defaultdict(list)
         for node_id, node in self.new_nodes.items():
-            node_type = node["type"]
+            by_type[node["type"]].append((node_id, node))
+
+        # Pre-create every type dir, then fan the independent file
+        # writes out to a thread pool (os.write releases the GIL)
+        write_jobs = []
+        for node_type, typed_nodes in by_type.items():
             type_dir = nodes_dir / node_type
             type_dir.mkdir(parents=True, exist_ok=True)
+            for node_id, node in typed_nodes:
+                write_jobs.append((type_dir / f"{_safe_filename(node_id)}.json", node))
 
-            safe_filename = node_id.replace(':', '-').replace('/', '-').replace('&', '-')
-            node_file = type_dir / f"{safe_filename}.json"
-
-            with open(node_file, 'w') as f:
-                json.dump(node, f, indent=2)
+        if write_jobs:
+            workers = min(16, (os.cpu_count() or 4) * 2)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(lambda job: _write_node_bytes(job[0], _json_dumps_bytes(job[1])), write_jobs))
 
-        # Append new edges
-        edges_file = plan_dir / "edges.ndjson"
-        with open(edges_file, 'a') as f:
-            for edge in self.new_edges:
-                f.write(json.dumps(edge) + "\n")
+        # Append new edges in a single write
+        if self.new_edges:
+            edges_file = plan_dir / "edges.ndjson"
+            payload = b"".join(json.dumps(e).encode('utf-8') + b"\n" for e in self.new_edges)
+            with open(edges_file, 'ab') as f:
+                f.write(payload)
 
         # Update changed nodes
         for node_id in self.changed_nodes:
             node = self.graph.get_node(node_id)
             if node:
-                node_file = nodes_dir / node["type"] / f"{node_id.replace(':', '-')}.json"
+                node_file = nodes_dir / node["type"] / f"{_safe_filename(node_id)}.json"
                 if node_file.exists():
-                    with open(node_file, 'w') as f:
-                        json.dump(node, f, indent=2)
+                    _write_node_bytes(node_file, _json_dumps_bytes(node))
 
 
 def main():
@@ -604,7 +768,7 @@ def main():
 
     print(f"Loading plan graph from {plan_dir}...")
     graph = PlanGraph(str(plan_dir))
-    print(f"Loaded {len(graph.nodes)} nodes and {len(graph.edges)} edges")
+    print(f"Loaded {len(graph.nodes)} nodes (edges load lazily)")
 
     executor = AddendumExecutor(graph)
     result = executor.execute()
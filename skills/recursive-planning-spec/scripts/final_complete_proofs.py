@@ -6,13 +6,85 @@ Continuously apply fixes until all proofs pass.
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Dict, List, Set
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+import contextlib
+import copy
+import io
 import re
 import subprocess
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Calling the verifier in-process skips interpreter startup and module
+# import on every iteration; fall back to a subprocess when the script
+# is not importable (e.g. run from a different working directory)
+try:
+    import verify_and_repair_planning as _vrp
+except ImportError:
+    _vrp = None
+
+# Sentinel returned by start_verification for the in-process path
+_VRP_INPROC = object()
+
+# Compact JSON by default; --pretty restores indented output for debugging
+PRETTY_OUTPUT = False
+
+
+def _json_loads(data):
+    """Parse JSON with orjson when installed, stdlib json otherwise"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _dumps_node_bytes(node: Dict) -> bytes:
+    """Serialize a node honoring PRETTY_OUTPUT, via orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(node, option=orjson.OPT_INDENT_2 if PRETTY_OUTPUT else 0)
+    if PRETTY_OUTPUT:
+        return json.dumps(node, indent=2).encode('utf-8')
+    return json.dumps(node, separators=(",", ":")).encode('utf-8')
+
+
+# Invariant fields of a generated InteractionSpec; _make_ix copies this
+# instead of rebuilding the whole literal per ChangeSpec
+_IX_TEMPLATE = {
+    "type": "InteractionSpec",
+    "method": "Svc.create()",
+    "interface": "API",
+    "operation": "POST /resource",
+    "state": {"token": "fresh", "quota": "under", "network": "ok"},
+    "pre": ["User authenticated", "Input validated"],
+    "in": {"params": "resource_data", "headers": ["Authorization"]},
+    "eff": ["Resource created"],
+    "err": {"retriable": ["5xx", "429"], "non_retriable": ["400", "401", "403"], "compensation": ["Rollback transaction"]},
+    "obs": {"logs": ["Operation start", "Operation complete"], "metrics": ["operation_create_count", "operation_create_duration"], "span": "api.create"},
+    "sec": {"authZ": "User owns resource or has permission", "least_priv": "Read/write own resources only", "pii": False},
+    "test": {"mocks": ["Database", "Auth service"], "acc": ["Given resource exists\nWhen user creates\nThen operation succeeds"]},
+    "depends_on": [],
+    "owner": "backend-team",
+    "est_h": 1,
+    "status": "Open",
+    "unaccounted": [],
+}
+
+
+def _make_ix(ix_id: str, change_id: str, stmt: str, now_iso: str) -> Dict:
+    """Build a fresh InteractionSpec from the shared template"""
+    ix = copy.deepcopy(_IX_TEMPLATE)
+    ix["id"] = ix_id
+    ix["stmt"] = stmt
+    ix["res"] = {"timeout_ms": 8000, "retry": {"strategy": "exp", "max": 4, "jitter": True}, "idem_key": f"create-{change_id}"}
+    ix["updated_at"] = now_iso
+    return ix
+
 
 def load_graph(plan_dir: Path) -> Dict:
     """Load plan graph"""
@@ -20,31 +92,67 @@ def load_graph(plan_dir: Path) -> Dict:
 
     nodes_dir = plan_dir / "nodes"
     if nodes_dir.exists():
-        for type_dir in nodes_dir.iterdir():
-            if type_dir.is_dir():
-                for node_file in type_dir.glob("*.json"):
-                    try:
-                        with open(node_file, 'r', encoding='utf-8') as f:
-                            node = json.load(f)
+        # scandir DirEntries cache the file type, avoiding the extra
+        # stat per entry that iterdir+glob with Path objects would issue
+        files = []
+        with os.scandir(nodes_dir) as it:
+            for type_entry in it:
+                if not type_entry.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(type_entry.path) as type_it:
+                    for file_entry in type_it:
+                        if file_entry.name.endswith(".json") and file_entry.is_file(follow_symlinks=False):
+                            files.append(file_entry.path)
+
+        def _parse(path):
+            try:
+                with open(path, "rb") as f:
+                    return _json_loads(f.read())
+            except Exception:
+                return None
+
+        # Parallel reads only pay off past a few hundred files; the pool
+        # overlaps file I/O while parses merge in submission order
+        if len(files) >= 200:
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as pool:
+                parsed = pool.map(_parse, files)
+                for node in parsed:
+                    if node is not None:
                         graph["nodes"][node.get("id")] = node
-                    except Exception:
-                        pass
+        else:
+            for node_file in files:
+                node = _parse(node_file)
+                if node is not None:
+                    graph["nodes"][node.get("id")] = node
 
+    # One bulk read and a byte-level split beats per-line text decoding
     edges_file = plan_dir / "edges.ndjson"
     if edges_file.exists():
-        with open(edges_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        edge = json.loads(line)
-                        graph["edges"].append(edge)
-                    except Exception:
-                        pass
+        for line in edges_file.read_bytes().split(b"\n"):
+            if line and not line.isspace():
+                try:
+                    edge = _json_loads(line)
+                    graph["edges"].append(edge)
+                except Exception:
+                    pass
 
     return graph
 
 
+# Single translation table replaces the chained .replace calls and the
+# regex scan; str.translate handles all unsafe characters in one pass
+_FN_TRANS = str.maketrans({c: "-" for c in ':/\\<>"|?*'})
+
+# Translation tables for deriving metric/span/flag names from node ids
+# in one pass instead of chained .replace calls
+_ID_TO_UNDER = str.maketrans(":", "_")
+_ID_TO_DASH = str.maketrans({":": "-", "/": "-", "\\": "-"})
+_DEL_PARENS = str.maketrans("", "", "()")
+
+# Matches proof result lines like "  P5: PASS" in verifier output
+_PROOF_RE = re.compile(r'^\s*(P\d+)\s*:\s*(PASS|FAIL)\b', re.MULTILINE)
+
+
 def save_node(plan_dir: Path, node_id: str, node: Dict):
     """Save node to graph"""
     node_type = node.get("type", "Unknown")
@@ -52,18 +160,30 @@ def save_node(plan_dir: Path, node_id: str, node: Dict):
     type_dir.mkdir(parents=True, exist_ok=True)
 
     # Sanitize filename
-    filename = node_id.replace(":", "-").replace("/", "-").replace("\\", "-")
-    filename = re.sub(r'[<>"|?*]', '-', filename)
+    filename = node_id.translate(_FN_TRANS)
     if len(filename) > 200:
         filename = filename[:200]
 
     node_file = type_dir / f"{filename}.json"
-    node_file.write_text(json.dumps(node, indent=2), encoding='utf-8')
+    node_file.write_bytes(_dumps_node_bytes(node))
+
+
+def stage_node(graph: Dict, dirty: Set[str], node_id: str, node: Dict):
+    """Record a modified node in memory; flush_dirty writes it later"""
+    graph["nodes"][node_id] = node
+    dirty.add(node_id)
+
+
+def flush_dirty(plan_dir: Path, graph: Dict, dirty: Set[str]):
+    """Write every staged node once, no matter how many fixers touched it"""
+    for node_id in dirty:
+        save_node(plan_dir, node_id, graph["nodes"][node_id])
+    dirty.clear()
 
 
-def fix_p5(plan_dir: Path, graph: Dict):
+def fix_p5(plan_dir: Path, graph: Dict, by_type: Dict[str, List[Dict]], dirty: Set[str]):
     """P5: Every Scenario has Test"""
-    scenarios = [n for n in graph["nodes"].values() if n.get("type") == "Scenario"]
+    scenarios = by_type["Scenario"]
 
     fixed = 0
     for scenario in scenarios:
@@ -76,7 +196,7 @@ def fix_p5(plan_dir: Path, graph: Dict):
             scenario["tests"] = test
             if "test" in scenario:
                 del scenario["test"]
-            save_node(plan_dir, scenario_id, scenario)
+            stage_node(graph, dirty, scenario_id, scenario)
             fixed += 1
             continue
 
@@ -86,7 +206,7 @@ def fix_p5(plan_dir: Path, graph: Dict):
                 "mocks": ["Database", "Auth service", "API client"],
                 "acc": [f"Given {scenario.get('stmt', scenario_id)[:50]}\nWhen user performs action\nThen scenario succeeds"]
             }
-            save_node(plan_dir, scenario_id, scenario)
+            stage_node(graph, dirty, scenario_id, scenario)
             fixed += 1
         elif not isinstance(tests, dict) or not tests.get("mocks") or not tests.get("acc"):
             tests = tests if isinstance(tests, dict) else {}
@@ -95,31 +215,32 @@ def fix_p5(plan_dir: Path, graph: Dict):
             if not tests.get("acc"):
                 tests["acc"] = [f"Given {scenario.get('stmt', scenario_id)[:50]}\nWhen user performs action\nThen scenario succeeds"]
             scenario["tests"] = tests
-            save_node(plan_dir, scenario_id, scenario)
+            stage_node(graph, dirty, scenario_id, scenario)
             fixed += 1
 
     return fixed
 
 
-def fix_p6(plan_dir: Path, graph: Dict):
+def fix_p6(plan_dir: Path, graph: Dict, by_type: Dict[str, List[Dict]], dirty: Set[str]):
     """P6: Obs on Component & IX"""
     fixed = 0
 
     # Components
-    components = [n for n in graph["nodes"].values() if n.get("type") == "Component"]
+    components = by_type["Component"]
     for component in components:
         if not component.get("observability"):
             component_id = component.get("id")
+            comp_base = component_id.translate(_ID_TO_UNDER)
             component["observability"] = {
                 "logs": ["Component lifecycle events"],
-                "metrics": [f"component_{component_id.replace(':', '_')}_count", f"component_{component_id.replace(':', '_')}_duration"],
-                "spans": f"component.{component_id.replace(':', '_')}"
+                "metrics": [f"component_{comp_base}_count", f"component_{comp_base}_duration"],
+                "spans": f"component.{comp_base}"
             }
-            save_node(plan_dir, component_id, component)
+            stage_node(graph, dirty, component_id, component)
             fixed += 1
 
     # InteractionSpecs
-    ix_list = [n for n in graph["nodes"].values() if n.get("type") == "InteractionSpec"]
+    ix_list = by_type["InteractionSpec"]
     for ix in ix_list:
         if not ix.get("obs") and not ix.get("observability"):
             ix_id = ix.get("id")
@@ -127,7 +248,7 @@ def fix_p6(plan_dir: Path, graph: Dict):
             operation = ix.get("operation", "POST /resource")
 
             # Extract operation name
-            op_name = method.split(".")[-1].replace("()", "").replace("(", "").replace(")", "")
+            op_name = method.split(".")[-1].translate(_DEL_PARENS)
             if not op_name:
                 op_name = operation.split()[0].lower() if operation else "operation"
 
@@ -136,129 +257,154 @@ def fix_p6(plan_dir: Path, graph: Dict):
                 "metrics": [f"operation_{op_name}_count", f"operation_{op_name}_duration"],
                 "span": f"api.{op_name}"
             }
-            save_node(plan_dir, ix_id, ix)
+            stage_node(graph, dirty, ix_id, ix)
             fixed += 1
 
     return fixed
 
 
-def fix_p7(plan_dir: Path, graph: Dict):
+def fix_p7(plan_dir: Path, graph: Dict, by_type: Dict[str, List[Dict]], dirty: Set[str], done: Set[str]):
     """P7: Semver + flags"""
     fixed = 0
 
-    # Contracts
-    contracts = [n for n in graph["nodes"].values() if n.get("type") == "Contract"]
+    # Contracts; versioning is set once and never unset, so nodes already
+    # handled in an earlier iteration are skipped via the done set
+    contracts = by_type["Contract"]
     for contract in contracts:
+        contract_id = contract.get("id")
+        if contract_id in done:
+            continue
         if not contract.get("versioning"):
-            contract_id = contract.get("id")
             contract["versioning"] = "semver:minor"
-            save_node(plan_dir, contract_id, contract)
+            stage_node(graph, dirty, contract_id, contract)
             fixed += 1
+        done.add(contract_id)
 
     # ChangeSpecs
-    changes = [n for n in graph["nodes"].values() if n.get("type") == "ChangeSpec"]
+    changes = by_type["ChangeSpec"]
     for change in changes:
+        change_id = change.get("id")
+        if change_id in done:
+            continue
         if not change.get("rollout_flag"):
-            change_id = change.get("id")
-            flag_base = change_id.replace("change:", "").replace(":", "-").replace("/", "-")[:50]
+            flag_base = change_id.removeprefix("change:").translate(_ID_TO_DASH)[:50]
             flag = f"feature.{flag_base}"
             change["rollout_flag"] = flag
-            save_node(plan_dir, change_id, change)
+            stage_node(graph, dirty, change_id, change)
             fixed += 1
+        done.add(change_id)
 
     return fixed
 
 
-def fix_p9(plan_dir: Path, graph: Dict):
+def fix_p9(plan_dir: Path, graph: Dict, by_type: Dict[str, List[Dict]], dirty: Set[str], edges_fp, done: Set[str]):
     """P9: Complete Requirements/ChangeSpecs expansion"""
     fixed = 0
 
     # ChangeSpecs missing InteractionSpecs
-    changes = [n for n in graph["nodes"].values() if n.get("type") == "ChangeSpec"]
+    changes = by_type["ChangeSpec"]
+
+    # One timestamp per pass; every IX created in it shares the stamp
+    now_iso = datetime.now(timezone.utc).isoformat()
 
     for change in changes:
+        # ix is added once and never removed; ChangeSpecs handled in an
+        # earlier iteration are skipped via the done set
+        change_id = change.get("id")
+        if change_id in done:
+            continue
+        done.add(change_id)
+
         if change.get("simple", False):
             continue
 
-        change_id = change.get("id")
         ix_list = change.get("ix", [])
 
         if not ix_list:
             # Create InteractionSpec
-            c_base = change_id.replace("change:", "").replace(":", "-").replace("/", "-")
+            c_base = change_id.removeprefix("change:").translate(_ID_TO_DASH)
             if len(c_base) > 80:
                 c_base = c_base[:80]
             ix_id = f"ix:{c_base}-api-create-fresh-under-ok"
 
             if not graph["nodes"].get(ix_id):
-                ix = {
-                    "id": ix_id,
-                    "type": "InteractionSpec",
-                    "stmt": f"Create operation via API for {change.get('stmt', change_id)[:50]}",
-                    "method": "Svc.create()",
-                    "interface": "API",
-                    "operation": "POST /resource",
-                    "state": {"token": "fresh", "quota": "under", "network": "ok"},
-                    "pre": ["User authenticated", "Input validated"],
-                    "in": {"params": "resource_data", "headers": ["Authorization"]},
-                    "eff": ["Resource created"],
-                    "err": {"retriable": ["5xx", "429"], "non_retriable": ["400", "401", "403"], "compensation": ["Rollback transaction"]},
-                    "res": {"timeout_ms": 8000, "retry": {"strategy": "exp", "max": 4, "jitter": True}, "idem_key": f"create-{change_id}"},
-                    "obs": {"logs": ["Operation start", "Operation complete"], "metrics": ["operation_create_count", "operation_create_duration"], "span": "api.create"},
-                    "sec": {"authZ": "User owns resource or has permission", "least_priv": "Read/write own resources only", "pii": False},
-                    "test": {"mocks": ["Database", "Auth service"], "acc": ["Given resource exists\nWhen user creates\nThen operation succeeds"]},
-                    "depends_on": [],
-                    "owner": "backend-team",
-                    "est_h": 1,
-                    "status": "Open",
-                    "unaccounted": [],
-                    "updated_at": datetime.now(timezone.utc).isoformat()
-                }
-                save_node(plan_dir, ix_id, ix)
+                ix = _make_ix(ix_id, change_id,
+                              f"Create operation via API for {change.get('stmt', change_id)[:50]}",
+                              now_iso)
+                stage_node(graph, dirty, ix_id, ix)
                 graph["nodes"][ix_id] = ix  # Update in-memory graph
+                by_type["InteractionSpec"].append(ix)
 
-                # Add edge
+                # Add edge; the shared handle is buffered, so this is an
+                # in-memory append until main() flushes it
                 edge = {"from": ix_id, "to": change_id, "type": "depends_on"}
-                edges_file = plan_dir / "edges.ndjson"
-                with open(edges_file, 'a', encoding='utf-8') as f:
-                    f.write(json.dumps(edge) + "\n")
+                edges_fp.write(json.dumps(edge) + "\n")
 
             # Update change
             if ix_id not in change.get("ix", []):
                 change["ix"] = change.get("ix", []) + [ix_id]
-                save_node(plan_dir, change_id, change)
+                stage_node(graph, dirty, change_id, change)
                 fixed += 1
 
     return fixed
 
 
-def run_verification() -> Dict:
-    """Run verification script and parse results"""
+def start_verification():
+    """Launch the verification script without waiting for it"""
+    if _vrp is not None:
+        return _VRP_INPROC
     try:
-        result = subprocess.run(
+        return subprocess.Popen(
             ["python", "verify_and_repair_planning.py"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
             encoding='utf-8'
         )
-        output = result.stdout + result.stderr
-
-        proofs = {}
-        for line in output.split("\n"):
-            if "P" in line and ":" in line:
-                parts = line.strip().split(":")
-                if len(parts) == 2:
-                    proof_name = parts[0].strip()
-                    proof_result = parts[1].strip()
-                    proofs[proof_name] = proof_result == "PASS"
-
-        return proofs
+    except Exception as e:
+        print(f"Error running verification: {e}")
+        return None
+
+
+def collect_verification(proc) -> Dict:
+    """Wait for a started verifier and parse its proof results"""
+    if proc is None:
+        return {}
+    if proc is _VRP_INPROC:
+        # Run the imported verifier here, capturing its report output
+        buf = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buf):
+                _vrp.main()
+        except SystemExit:
+            pass
+        except Exception as e:
+            print(f"Error running verification: {e}")
+            return {}
+        return {m.group(1): m.group(2) == "PASS"
+                for m in _PROOF_RE.finditer(buf.getvalue())}
+    try:
+        stdout, stderr = proc.communicate()
+        output = stdout + stderr
+
+        # One compiled-regex scan instead of split/strip per output line
+        return {m.group(1): m.group(2) == "PASS"
+                for m in _PROOF_RE.finditer(output)}
     except Exception as e:
         print(f"Error running verification: {e}")
         return {}
 
 
+def run_verification() -> Dict:
+    """Run verification synchronously and parse results"""
+    return collect_verification(start_verification())
+
+
 def main():
+    global PRETTY_OUTPUT
+    if "--pretty" in sys.argv:
+        PRETTY_OUTPUT = True
+
     plan_dir = Path("plan-fixed")
 
     if not plan_dir.exists():
@@ -272,39 +418,103 @@ def main():
     print("FINAL PROOF COMPLETION - LOOP UNTIL ALL PASS")
     print("=" * 80)
 
-    while iteration < max_iterations:
-        iteration += 1
-        print(f"\n[ITERATION {iteration}]")
-
-        # Load graph
-        graph = load_graph(plan_dir)
-
-        # Apply fixes
-        p5_fixed = fix_p5(plan_dir, graph)
-        p6_fixed = fix_p6(plan_dir, graph)
-        p7_fixed = fix_p7(plan_dir, graph)
-        p9_fixed = fix_p9(plan_dir, graph)
-
-        total_fixed = p5_fixed + p6_fixed + p7_fixed + p9_fixed
-
-        print(f"  Fixed: P5={p5_fixed}, P6={p6_fixed}, P7={p7_fixed}, P9={p9_fixed} (Total={total_fixed})")
-
-        if total_fixed == 0:
-            print("  No more fixes to apply")
-            break
+    # On a warm restart the plan may already be clean; one up-front
+    # verification avoids a full load+fix+verify cycle in that case
+    proofs = run_verification()
+    if proofs and all(proofs.values()):
+        print("\n[OK] ALL PROOFS ALREADY PASSING!")
+        return
+
+    # The verifier subprocess runs concurrently with the next
+    # iteration's load+fix pass; its result is collected one
+    # iteration later
+    verifier = None
+
+    # Load once; the fixers keep the in-memory graph authoritative, so a
+    # reload is only needed after the repair-capable verifier reported
+    # failures (it may have rewritten node files itself)
+    graph = load_graph(plan_dir)
+    reload_needed = False
+
+    # Node ids already brought into compliance; survives graph reloads
+    # because the fixed fields are set once and never unset
+    p7_done: Set[str] = set()
+    p9_done: Set[str] = set()
+
+    # One buffered append handle for the whole run; fixers write new
+    # edges to it and it is flushed only before the verifier looks at
+    # the file
+    with (plan_dir / "edges.ndjson").open("a", encoding="utf-8", buffering=1 << 20) as edges_fp:
+        while iteration < max_iterations:
+            iteration += 1
+            print(f"\n[ITERATION {iteration}]")
+
+            graph_fresh = iteration == 1
+            if reload_needed:
+                graph = load_graph(plan_dir)
+                reload_needed = False
+                graph_fresh = True
+
+            # Bucket nodes by type once per iteration; the fixers would
+            # otherwise each rescan the full node dict
+            by_type: Dict[str, List[Dict]] = defaultdict(list)
+            for n in graph["nodes"].values():
+                by_type[n.get("type", "Unknown")].append(n)
+
+            # Skip fixers whose node types are absent from this plan; an O(1)
+            # set test beats iterating an empty bucket through the fixer
+            present = set(by_type)
+
+            # Apply fixes, staging touched nodes in memory; a node hit by
+            # several fixers is then serialized and written only once
+            dirty: Set[str] = set()
+            p5_fixed = fix_p5(plan_dir, graph, by_type, dirty) if "Scenario" in present else 0
+            p6_fixed = fix_p6(plan_dir, graph, by_type, dirty) if present & {"Component", "InteractionSpec"} else 0
+            p7_fixed = fix_p7(plan_dir, graph, by_type, dirty, p7_done) if present & {"Contract", "ChangeSpec"} else 0
+            p9_fixed = fix_p9(plan_dir, graph, by_type, dirty, edges_fp, p9_done) if "ChangeSpec" in present else 0
+            flush_dirty(plan_dir, graph, dirty)
+
+            total_fixed = p5_fixed + p6_fixed + p7_fixed + p9_fixed
+
+            print(f"  Fixed: P5={p5_fixed}, P6={p6_fixed}, P7={p7_fixed}, P9={p9_fixed} (Total={total_fixed})")
+
+            # Collect the verifier launched after the previous iteration's
+            # fixes; it has been running while this iteration loaded and
+            # fixed the graph. The in-process verifier actually runs at
+            # collect time, so flush the edges buffered by this
+            # iteration's fixes before it reads edges.ndjson
+            if verifier is not None:
+                edges_fp.flush()
+                proofs = collect_verification(verifier)
+                verifier = None
+                if proofs:
+                    failing = [p for p, passed in proofs.items() if not passed]
+                    if not failing and total_fixed == 0:
+                        print("\n[OK] ALL PROOFS PASSING!")
+                        break
+                    if failing:
+                        print(f"  Still failing: {', '.join(failing)}")
+                        reload_needed = True
+                else:
+                    print("  Could not verify proofs")
+
+            # A zero-fix iteration is only terminal when it ran on fresh
+            # disk state; the verifier may have written nodes the
+            # in-memory graph has not seen, so give the fixers one pass
+            # over a reload before concluding there is no more work —
+            # the same decision the baseline made by reloading every
+            # iteration
+            if total_fixed == 0 and graph_fresh:
+                print("  No more fixes to apply")
+                break
 
-        # Run verification
-        proofs = run_verification()
+            # Run verification in the background while the next iteration
+            # reloads and fixes; flush pending edges so it sees them
+            edges_fp.flush()
+            verifier = start_verification()
 
-        if proofs:
-            failing = [p for p, passed in proofs.items() if not passed]
-            if not failing:
-                print("\n[OK] ALL PROOFS PASSING!")
-                break
-            else:
-                print(f"  Still failing: {', '.join(failing)}")
-        else:
-            print("  Could not verify proofs")
+    if verifier is not None:
+        collect_verification(verifier)
 
     print("\n" + "=" * 80)
     print("[OK] COMPLETION FINISHED")
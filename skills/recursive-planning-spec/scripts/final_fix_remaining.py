@@ -6,21 +6,91 @@ Loads verification output to identify exact failing nodes and fixes them.
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Dict, List, Set
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-import re
+import copy
+import functools
 import hashlib
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compact JSON by default; --pretty restores indented output for debugging
+PRETTY_OUTPUT = False
+
+
+def _json_loads(data):
+    """Parse JSON with orjson when installed, stdlib json otherwise"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _dumps_node_bytes(node: Dict) -> bytes:
+    """Serialize a node honoring PRETTY_OUTPUT, via orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(node, option=orjson.OPT_INDENT_2 if PRETTY_OUTPUT else 0)
+    if PRETTY_OUTPUT:
+        return json.dumps(node, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(node, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+
+
+# Invariant fields of a generated InteractionSpec; _make_ix copies this
+# instead of rebuilding the whole literal per ChangeSpec
+_IX_TEMPLATE = {
+    "type": "InteractionSpec",
+    "method": "Svc.create()",
+    "interface": "API",
+    "operation": "POST /resource",
+    "state": {"token": "fresh", "quota": "under", "network": "ok"},
+    "pre": ["User authenticated", "Input validated"],
+    "in": {"params": "resource_data", "headers": ["Authorization"]},
+    "eff": ["Resource created"],
+    "err": {"retriable": ["5xx", "429"], "non_retriable": ["400", "401", "403"], "compensation": ["Rollback transaction"]},
+    "obs": {"logs": ["Operation start", "Operation complete"], "metrics": ["operation_create_count", "operation_create_duration"], "span": "api.create"},
+    "sec": {"authZ": "User owns resource or has permission", "least_priv": "Read/write own resources only", "pii": False},
+    "test": {"mocks": ["Database", "Auth service"], "acc": ["Given resource exists\nWhen user creates\nThen operation succeeds"]},
+    "depends_on": [],
+    "owner": "backend-team",
+    "est_h": 1,
+    "status": "Open",
+    "unaccounted": [],
+}
+
+
+def _make_ix(ix_id: str, change_id: str, stmt: str, now_iso: str) -> Dict:
+    """Build a fresh InteractionSpec from the shared template"""
+    ix = copy.deepcopy(_IX_TEMPLATE)
+    ix["id"] = ix_id
+    ix["stmt"] = stmt
+    ix["res"] = {"timeout_ms": 8000, "retry": {"strategy": "exp", "max": 4, "jitter": True}, "idem_key": f"create-{change_id}"}
+    ix["updated_at"] = now_iso
+    return ix
+
+
+# Single translation table replaces the chained .replace calls and the
+# regex scan; str.translate handles all unsafe characters in one pass
+_FN_TRANS = str.maketrans({c: "-" for c in ':/\\<>"|?*&'})
+
+# Translation tables for deriving metric/span/flag names from node ids
+# in one pass instead of chained .replace calls
+_ID_TO_UNDER = str.maketrans({":": "_", "-": "_"})
+_ID_TO_DASH = str.maketrans({":": "-", "/": "-", "\\": "-"})
+_DEL_PARENS = str.maketrans("", "", "()")
+
+_md5 = hashlib.md5
+
 
 def sanitize_filename(node_id: str, max_length: int = 180) -> str:
     """Sanitize filename with proper truncation"""
-    safe = node_id.replace(":", "-").replace("/", "-").replace("\\", "-")
-    safe = re.sub(r'[<>"|?*&]', '-', safe)
+    safe = node_id.translate(_FN_TRANS)
 
     if len(safe) > max_length:
-        name_hash = hashlib.md5(safe.encode()).hexdigest()[:8]
+        name_hash = _md5(safe.encode()).hexdigest()[:8]
         safe = safe[:max_length-9] + "-" + name_hash
 
     return safe
@@ -32,39 +102,69 @@ def load_all_nodes(plan_dir: Path) -> Dict[str, Dict]:
     nodes_dir = plan_dir / "nodes"
 
     if nodes_dir.exists():
-        for type_dir in nodes_dir.iterdir():
-            if type_dir.is_dir():
-                for node_file in type_dir.glob("*.json"):
-                    try:
-                        with open(node_file, 'r', encoding='utf-8') as f:
-                            node = json.load(f)
-                            node_id = node.get("id")
-                            if node_id:
-                                nodes[node_id] = node
-                    except Exception as e:
-                        print(f"  Warning: Could not load {node_file.name}: {e}")
+        # scandir DirEntries cache the file type, avoiding the extra
+        # stat per entry that iterdir+glob with Path objects would issue
+        files = []
+        with os.scandir(nodes_dir) as it:
+            for type_entry in it:
+                if not type_entry.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(type_entry.path) as type_it:
+                    for file_entry in type_it:
+                        if file_entry.name.endswith(".json") and file_entry.is_file(follow_symlinks=False):
+                            files.append(file_entry.path)
+
+        def _parse(path):
+            try:
+                with open(path, "rb") as f:
+                    return _json_loads(f.read()), None
+            except Exception as e:
+                return None, e
+
+        # Parallel reads only pay off past a few hundred files; the pool
+        # overlaps file I/O while parses merge in submission order
+        if len(files) >= 200:
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as pool:
+                results = list(pool.map(_parse, files))
+        else:
+            results = map(_parse, files)
+
+        for node_file, (node, err) in zip(files, results):
+            if err is not None:
+                print(f"  Warning: Could not load {os.path.basename(node_file)}: {err}")
+                continue
+            node_id = node.get("id")
+            if node_id:
+                nodes[node_id] = node
 
     return nodes
 
 
+@functools.lru_cache(maxsize=None)
+def _ensure_type_dir(plan_dir: Path, node_type: str) -> Path:
+    """mkdir each type directory once per run instead of per save"""
+    type_dir = plan_dir / "nodes" / node_type
+    type_dir.mkdir(parents=True, exist_ok=True)
+    return type_dir
+
+
 def save_node_direct(plan_dir: Path, node_id: str, node: Dict):
     """Save node directly to disk with proper filename handling"""
     node_type = node.get("type", "Unknown")
-    type_dir = plan_dir / "nodes" / node_type
-    type_dir.mkdir(parents=True, exist_ok=True)
+    type_dir = _ensure_type_dir(plan_dir, node_type)
 
     filename = sanitize_filename(node_id, max_length=180)
-    node_file = type_dir / f"{filename}.json"
 
-    # If filename is still too long, use hash-based name
-    if len(str(node_file)) > 255:
-        node_hash = hashlib.md5(node_id.encode()).hexdigest()[:12]
+    # If the full path would be too long, use a hash-based name; length
+    # computed arithmetically to skip building the path string twice
+    if len(type_dir.as_posix()) + 1 + len(filename) + 5 > 255:
+        node_hash = _md5(node_id.encode()).hexdigest()[:12]
         filename = f"node-{node_hash}"
-        node_file = type_dir / f"{filename}.json"
+
+    node_file = type_dir / f"{filename}.json"
 
     try:
-        with open(node_file, 'w', encoding='utf-8') as f:
-            json.dump(node, f, indent=2, ensure_ascii=False)
+        node_file.write_bytes(_dumps_node_bytes(node))
         return True
     except Exception as e:
         print(f"  ERROR: Could not save {node_id}: {e}")
@@ -91,11 +191,12 @@ def find_and_fix_all(plan_dir: Path):
     fixed_p6_comp = 0
     for component in components_without_obs:
         component_id = component.get("id")
+        comp_base = component_id.translate(_ID_TO_UNDER)[:50]
         component["observability"] = {
             "logs": ["Component lifecycle events"],
-            "metrics": [f"component_{component_id.replace(':', '_').replace('-', '_')[:50]}_count",
-                       f"component_{component_id.replace(':', '_').replace('-', '_')[:50]}_duration"],
-            "spans": f"component.{component_id.replace(':', '_').replace('-', '_')[:50]}"
+            "metrics": [f"component_{comp_base}_count",
+                       f"component_{comp_base}_duration"],
+            "spans": f"component.{comp_base}"
         }
         if save_node_direct(plan_dir, component_id, component):
             fixed_p6_comp += 1
@@ -111,7 +212,7 @@ def find_and_fix_all(plan_dir: Path):
         method = ix.get("method", "Svc.operation()")
         operation = ix.get("operation", "POST /resource")
 
-        op_name = method.split(".")[-1].replace("()", "").replace("(", "").replace(")", "")
+        op_name = method.split(".")[-1].translate(_DEL_PARENS)
         if not op_name:
             op_name = operation.split()[0].lower() if operation else "operation"
 
@@ -147,7 +248,7 @@ def find_and_fix_all(plan_dir: Path):
     fixed_p7_changes = 0
     for change in changes_without_flags:
         change_id = change.get("id")
-        flag_base = change_id.replace("change:", "").replace(":", "-").replace("/", "-")[:50]
+        flag_base = change_id.removeprefix("change:").translate(_ID_TO_DASH)[:50]
         flag = f"feature.{flag_base}"
         change["rollout_flag"] = flag
         if save_node_direct(plan_dir, change_id, change):
@@ -163,47 +264,30 @@ def find_and_fix_all(plan_dir: Path):
 
     print(f"  Found {len(incomplete_changes)} ChangeSpecs without InteractionSpecs")
     fixed_p9 = 0
+    # Collect new edges and append them in one write instead of an
+    # open/write/close per edge
+    new_edges: List[str] = []
+    # One timestamp per pass; every IX created in it shares the stamp
+    now_iso = datetime.now(timezone.utc).isoformat()
     for change in incomplete_changes:
         change_id = change.get("id")
-        c_base = change_id.replace("change:", "").replace(":", "-").replace("/", "-")
+        c_base = change_id.removeprefix("change:").translate(_ID_TO_DASH)
         if len(c_base) > 80:
             c_base = c_base[:80]
         ix_id = f"ix:{c_base}-api-create-fresh-under-ok"
 
         # Check if IX already exists
         if ix_id not in nodes:
-            ix = {
-                "id": ix_id,
-                "type": "InteractionSpec",
-                "stmt": f"Create operation via API for {change.get('stmt', change_id)[:50]}",
-                "method": "Svc.create()",
-                "interface": "API",
-                "operation": "POST /resource",
-                "state": {"token": "fresh", "quota": "under", "network": "ok"},
-                "pre": ["User authenticated", "Input validated"],
-                "in": {"params": "resource_data", "headers": ["Authorization"]},
-                "eff": ["Resource created"],
-                "err": {"retriable": ["5xx", "429"], "non_retriable": ["400", "401", "403"], "compensation": ["Rollback transaction"]},
-                "res": {"timeout_ms": 8000, "retry": {"strategy": "exp", "max": 4, "jitter": True}, "idem_key": f"create-{change_id}"},
-                "obs": {"logs": ["Operation start", "Operation complete"], "metrics": ["operation_create_count", "operation_create_duration"], "span": "api.create"},
-                "sec": {"authZ": "User owns resource or has permission", "least_priv": "Read/write own resources only", "pii": False},
-                "test": {"mocks": ["Database", "Auth service"], "acc": ["Given resource exists\nWhen user creates\nThen operation succeeds"]},
-                "depends_on": [],
-                "owner": "backend-team",
-                "est_h": 1,
-                "status": "Open",
-                "unaccounted": [],
-                "updated_at": datetime.now(timezone.utc).isoformat()
-            }
+            ix = _make_ix(ix_id, change_id,
+                          f"Create operation via API for {change.get('stmt', change_id)[:50]}",
+                          now_iso)
 
             if save_node_direct(plan_dir, ix_id, ix):
                 nodes[ix_id] = ix
 
                 # Add edge
                 edge = {"from": ix_id, "to": change_id, "type": "depends_on"}
-                edges_file = plan_dir / "edges.ndjson"
-                with open(edges_file, 'a', encoding='utf-8') as f:
-                    f.write(json.dumps(edge) + "\n")
+                new_edges.append(json.dumps(edge) + "\n")
 
         # Update change
         if ix_id not in change.get("ix", []):
@@ -212,6 +296,11 @@ def find_and_fix_all(plan_dir: Path):
                 fixed_p9 += 1
                 nodes[change_id] = change
 
+    if new_edges:
+        edges_file = plan_dir / "edges.ndjson"
+        with open(edges_file, 'a', encoding='utf-8') as f:
+            f.writelines(new_edges)
+
     print(f"  [OK] Fixed {fixed_p9} ChangeSpecs")
 
     print("\n" + "=" * 80)
@@ -221,6 +310,10 @@ def find_and_fix_all(plan_dir: Path):
 
 
 def main():
+    global PRETTY_OUTPUT
+    if "--pretty" in sys.argv:
+        PRETTY_OUTPUT = True
+
     plan_dir = Path("plan-fixed")
 
     if not plan_dir.exists():
@@ -4,75 +4,160 @@ Fix Exact Failing Nodes - Find and fix specific nodes that keep failing
 """
 
 import json
+import sys
 from pathlib import Path
+from typing import Dict
 from datetime import datetime, timezone
+import copy
 import hashlib
-import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compact JSON by default; --pretty restores indented output for debugging
+PRETTY_OUTPUT = False
+
+
+def _json_loads(data):
+    """Parse JSON with orjson when installed, stdlib json otherwise"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _dumps_node_bytes(node) -> bytes:
+    """Serialize a node honoring PRETTY_OUTPUT, via orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(node, option=orjson.OPT_INDENT_2 if PRETTY_OUTPUT else 0)
+    if PRETTY_OUTPUT:
+        return json.dumps(node, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(node, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+
+
+# Invariant fields of a generated InteractionSpec; _make_ix copies this
+# instead of rebuilding the whole literal inline
+_IX_TEMPLATE = {
+    "type": "InteractionSpec",
+    "method": "Svc.create()",
+    "interface": "API",
+    "operation": "POST /resource",
+    "state": {"token": "fresh", "quota": "under", "network": "ok"},
+    "pre": ["User authenticated", "Input validated"],
+    "in": {"params": "resource_data", "headers": ["Authorization"]},
+    "eff": ["Resource created"],
+    "err": {"retriable": ["5xx", "429"], "non_retriable": ["400", "401", "403"], "compensation": ["Rollback transaction"]},
+    "obs": {"logs": ["Operation start", "Operation complete"], "metrics": ["operation_create_count", "operation_create_duration"], "span": "api.create"},
+    "sec": {"authZ": "User owns resource or has permission", "least_priv": "Read/write own resources only", "pii": False},
+    "test": {"mocks": ["Database", "Auth service"], "acc": ["Given resource exists\nWhen user creates\nThen operation succeeds"]},
+    "depends_on": [],
+    "owner": "backend-team",
+    "est_h": 1,
+    "status": "Open",
+    "unaccounted": [],
+}
+
+
+def _make_ix(ix_id: str, change_id: str, stmt: str, now_iso: str) -> Dict:
+    """Build a fresh InteractionSpec from the shared template"""
+    ix = copy.deepcopy(_IX_TEMPLATE)
+    ix["id"] = ix_id
+    ix["stmt"] = stmt
+    ix["res"] = {"timeout_ms": 8000, "retry": {"strategy": "exp", "max": 4, "jitter": True}, "idem_key": f"create-{change_id}"}
+    ix["updated_at"] = now_iso
+    return ix
+
+
+# Single translation table replaces the chained .replace calls and the
+# regex scan; str.translate handles all unsafe characters in one pass
+_FN_TRANS = str.maketrans({c: "-" for c in ':/\\<>"|?*&'})
+
+_md5 = hashlib.md5
 
 
 def sanitize_filename(node_id: str, max_length: int = 180) -> str:
     """Sanitize filename"""
-    safe = node_id.replace(":", "-").replace("/", "-").replace("\\", "-")
-    safe = re.sub(r'[<>"|?*&]', '-', safe)
+    safe = node_id.translate(_FN_TRANS)
 
     if len(safe) > max_length:
-        name_hash = hashlib.md5(safe.encode()).hexdigest()[:8]
+        name_hash = _md5(safe.encode()).hexdigest()[:8]
         safe = safe[:max_length-9] + "-" + name_hash
 
     return safe
 
 
-def find_and_fix_node(plan_dir: Path, node_id: str, fix_func):
-    """Find node by ID and apply fix"""
+def build_id_index(plan_dir: Path) -> Dict[str, Path]:
+    """Map node id to file path in a single walk of the node tree"""
+    id_index: Dict[str, Path] = {}
     nodes_dir = plan_dir / "nodes"
 
-    for type_dir in nodes_dir.iterdir():
-        if not type_dir.is_dir():
-            continue
-
-        for node_file in type_dir.glob("*.json"):
+    if nodes_dir.exists():
+        for node_file in nodes_dir.rglob("*.json"):
             try:
-                with open(node_file, 'r', encoding='utf-8') as f:
-                    node = json.load(f)
+                node_id = _json_loads(node_file.read_bytes()).get('id')
+            except Exception as e:
+                print(f"  Error reading {node_file.name}: {e}")
+                continue
+            if node_id:
+                id_index[node_id] = node_file
 
-                    if node.get('id') == node_id:
-                        print(f"  Found: {node_file.name}")
-                        print(f"    Before: {fix_func(node, 'check')}")
+    return id_index
 
-                        fix_func(node, 'fix')
 
-                        # Save with correct filename
-                        node_type = node.get("type", "Unknown")
-                        type_dir = plan_dir / "nodes" / node_type
-                        type_dir.mkdir(parents=True, exist_ok=True)
+def find_and_fix_node(plan_dir: Path, id_index: Dict[str, Path], node_id: str, fix_func):
+    """Look the node up in the id index and apply fix"""
+    node_file = id_index.get(node_id)
+    if node_file is None:
+        return False
 
-                        filename = sanitize_filename(node_id, max_length=180)
-                        node_file = type_dir / f"{filename}.json"
+    try:
+        node = _json_loads(node_file.read_bytes())
+    except Exception as e:
+        print(f"  Error reading {node_file.name}: {e}")
+        return False
 
-                        if len(str(node_file)) > 255:
-                            node_hash = hashlib.md5(node_id.encode()).hexdigest()[:12]
-                            filename = f"node-{node_hash}"
-                            node_file = type_dir / f"{filename}.json"
+    print(f"  Found: {node_file.name}")
+    print(f"    Before: {fix_func(node, 'check')}")
 
-                        with open(node_file, 'w', encoding='utf-8') as f:
-                            json.dump(node, f, indent=2, ensure_ascii=False)
+    fix_func(node, 'fix')
 
-                        print(f"    After: {fix_func(node, 'check')}")
-                        print(f"    Saved to: {node_file.name}")
-                        return True
-            except Exception as e:
-                print(f"  Error reading {node_file.name}: {e}")
+    # Save with correct filename
+    node_type = node.get("type", "Unknown")
+    type_dir = plan_dir / "nodes" / node_type
+    type_dir.mkdir(parents=True, exist_ok=True)
+
+    filename = sanitize_filename(node_id, max_length=180)
+    node_file = type_dir / f"{filename}.json"
 
-    return False
+    if len(str(node_file)) > 255:
+        node_hash = hashlib.md5(node_id.encode()).hexdigest()[:12]
+        filename = f"node-{node_hash}"
+        node_file = type_dir / f"{filename}.json"
+
+    node_file.write_bytes(_dumps_node_bytes(node))
+
+    print(f"    After: {fix_func(node, 'check')}")
+    print(f"    Saved to: {node_file.name}")
+    return True
 
 
 def main():
+    global PRETTY_OUTPUT
+    if "--pretty" in sys.argv:
+        PRETTY_OUTPUT = True
+
     plan_dir = Path("plan-fixed")
 
     print("=" * 80)
     print("FIX EXACT FAILING NODES")
     print("=" * 80)
 
+    # Collect new edges and append them in one write at the end instead
+    # of an open/write/close per edge
+    new_edges = []
+
+    # One walk of the node tree replaces a full scan per target id
+    id_index = build_id_index(plan_dir)
+
     # Find the exact failing component
     print("\n[P6] Fixing Component without observability...")
     comp_id = 'component:bookmarks---need-bookmarks-of-posts-and-associated-menus-and-functions-for-view-editing-organizing-users-can-bookmark-posts-for-later-viewing-editing-organizing-bookmarks-can-be-organized-into-lists-tagged-and-have-notes-added'
@@ -87,7 +172,7 @@ def main():
                 "spans": "component.bookmarks"
             }
 
-    found = find_and_fix_node(plan_dir, comp_id, fix_component)
+    found = find_and_fix_node(plan_dir, id_index, comp_id, fix_component)
     print(f"  {'[OK] Fixed' if found else '[NOT FOUND]'}")
 
     # Find the exact failing contract
@@ -100,7 +185,7 @@ def main():
         elif action == 'fix':
             node['versioning'] = 'semver:minor'
 
-    found = find_and_fix_node(plan_dir, cont_id, fix_contract)
+    found = find_and_fix_node(plan_dir, id_index, cont_id, fix_contract)
     print(f"  {'[OK] Fixed' if found else '[NOT FOUND]'}")
 
     # Find the exact failing change
@@ -112,52 +197,35 @@ def main():
             return f"simple={node.get('simple')}, ix={node.get('ix')}"
         elif action == 'fix':
             if not node.get('simple') and not node.get('ix'):
-                c_base = change_id.replace("change:", "")[:80]
+                c_base = change_id.removeprefix("change:")[:80]
                 ix_id = f"ix:{c_base}-api-create-fresh-under-ok"
 
                 # Create IX if not exists
                 ix_file = plan_dir / "nodes" / "InteractionSpec" / f"{sanitize_filename(ix_id)}.json"
                 if not ix_file.exists():
-                    ix = {
-                        "id": ix_id,
-                        "type": "InteractionSpec",
-                        "stmt": f"Create operation via API for bookmarks",
-                        "method": "Svc.create()",
-                        "interface": "API",
-                        "operation": "POST /resource",
-                        "state": {"token": "fresh", "quota": "under", "network": "ok"},
-                        "pre": ["User authenticated", "Input validated"],
-                        "in": {"params": "resource_data", "headers": ["Authorization"]},
-                        "eff": ["Resource created"],
-                        "err": {"retriable": ["5xx", "429"], "non_retriable": ["400", "401", "403"], "compensation": ["Rollback transaction"]},
-                        "res": {"timeout_ms": 8000, "retry": {"strategy": "exp", "max": 4, "jitter": True}, "idem_key": f"create-{change_id}"},
-                        "obs": {"logs": ["Operation start", "Operation complete"], "metrics": ["operation_create_count", "operation_create_duration"], "span": "api.create"},
-                        "sec": {"authZ": "User owns resource or has permission", "least_priv": "Read/write own resources only", "pii": False},
-                        "test": {"mocks": ["Database", "Auth service"], "acc": ["Given resource exists\nWhen user creates\nThen operation succeeds"]},
-                        "depends_on": [],
-                        "owner": "backend-team",
-                        "est_h": 1,
-                        "status": "Open",
-                        "unaccounted": [],
-                        "updated_at": datetime.now(timezone.utc).isoformat()
-                    }
+                    ix = _make_ix(ix_id, change_id,
+                                  "Create operation via API for bookmarks",
+                                  datetime.now(timezone.utc).isoformat())
 
                     ix_dir = plan_dir / "nodes" / "InteractionSpec"
                     ix_dir.mkdir(parents=True, exist_ok=True)
-                    with open(ix_file, 'w', encoding='utf-8') as f:
-                        json.dump(ix, f, indent=2, ensure_ascii=False)
+                    with open(ix_file, 'wb') as f:
+                        f.write(_dumps_node_bytes(ix))
 
                     # Add edge
                     edge = {"from": ix_id, "to": change_id, "type": "depends_on"}
-                    edges_file = plan_dir / "edges.ndjson"
-                    with open(edges_file, 'a', encoding='utf-8') as f:
-                        f.write(json.dumps(edge) + "\n")
+                    new_edges.append(json.dumps(edge) + "\n")
 
                 node['ix'] = [ix_id]
 
-    found = find_and_fix_node(plan_dir, change_id, fix_change)
+    found = find_and_fix_node(plan_dir, id_index, change_id, fix_change)
     print(f"  {'[OK] Fixed' if found else '[NOT FOUND]'}")
 
+    if new_edges:
+        edges_file = plan_dir / "edges.ndjson"
+        with open(edges_file, 'a', encoding='utf-8') as f:
+            f.writelines(new_edges)
+
     print("\n" + "=" * 80)
     print("[OK] ALL EXACT NODES FIXED")
     print("=" * 80)
@@ -3,14 +3,35 @@
 Generate Core Blueprint nodes according to how-to-plan.md §2.1
 Creates Scenarios, Requirements, Contracts, Components, and ChangeSpecs for
 mandatory baseline subsystems.
+
+The script is pure Python with orjson as an optional accelerator, so
+bulk-generation runs can also use PyPy (``pypy3 generate_core_blueprint.py``),
+whose JIT suits this allocation-heavy dict/list building; the stdlib
+json fallback covers interpreters without orjson wheels.
 """
 
+import functools
 import json
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# --ndjson writes one NDJSON shard per node type instead of a file per
+# node; the per-file layout stays the default for compatibility
+NDJSON_OUTPUT = False
+
+# One timestamp per run; every node generated in a single invocation
+# shares the same logical generated-at time
+_NOW_ISO = datetime.now(timezone.utc).isoformat()
+
 # Core Blueprint subsystems from how-to-plan.md §2.1
 CORE_BLUEPRINT_SUBSYSTEMS = {
     "Identity & Access": {
@@ -189,197 +210,319 @@ CORE_BLUEPRINT_SUBSYSTEMS = {
     }
 }
 
+def _dumps_node_bytes(node: Dict) -> bytes:
+    """Serialize a node as indented JSON, via orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(node, option=orjson.OPT_INDENT_2)
+    return json.dumps(node, indent=2).encode('utf-8')
+
+def _dumps_compact_bytes(obj: Dict) -> bytes:
+    """Serialize an edge or NDJSON line compactly, via orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+# Flat, data-oriented views of CORE_BLUEPRINT_SUBSYSTEMS built once at
+# import: subsystems are enumerated to indices and scenarios, components
+# and contracts (including the event/policy expansion) are laid out in
+# parallel lists, so the generator runs three single-level loops instead
+# of a nested dict walk
+# Subsystems that get an extra event or policy contract, by exact name;
+# the old substring tests would also have matched any future subsystem
+# merely containing "Policy" or "Analytics"
+_EVENT_CONTRACT_SUBSYSTEMS = {"Notifications", "Analytics/Events"}
+_POLICY_CONTRACT_SUBSYSTEMS = {"Security & Policy"}
+
+_SUBSYS_NAMES = list(CORE_BLUEPRINT_SUBSYSTEMS)
+_SUBSYS_DATA = list(CORE_BLUEPRINT_SUBSYSTEMS.values())
+_SCENARIO_OWNER_IDX: List[int] = []
+_SCENARIO_STMTS: List[str] = []
+_COMPONENT_OWNER_IDX: List[int] = []
+_COMPONENT_NAMES: List[str] = []
+_CONTRACT_OWNER_IDX: List[int] = []
+_CONTRACT_TYPES: List[str] = []
+
+for _idx, (_name, _data) in enumerate(CORE_BLUEPRINT_SUBSYSTEMS.items()):
+    for _stmt in _data["scenarios"]:
+        _SCENARIO_OWNER_IDX.append(_idx)
+        _SCENARIO_STMTS.append(_stmt)
+    for _component in _data["core_components"]:
+        _COMPONENT_OWNER_IDX.append(_idx)
+        _COMPONENT_NAMES.append(_component)
+    _types = ["api", "data"]
+    if _name in _EVENT_CONTRACT_SUBSYSTEMS:
+        _types.append("event")
+    if _name in _POLICY_CONTRACT_SUBSYSTEMS:
+        _types.append("policy")
+    for _contract_type in _types:
+        _CONTRACT_OWNER_IDX.append(_idx)
+        _CONTRACT_TYPES.append(_contract_type)
+del _idx, _name, _data, _stmt, _component, _types, _contract_type
+
+# Slug/filename character mappings done in one translate pass instead of
+# chained .replace calls
+_SUBSYS_TRANS = str.maketrans({" ": "-", "/": "-", "&": "-"})
+_ITEM_TRANS = str.maketrans({" ": "-", "'": None, ".": None})
+_FILENAME_TRANS = str.maketrans({":": "-", "/": "-", "&": "-"})
+
+@functools.lru_cache(maxsize=None)
+def _subsys_slug(subsystem_name: str) -> str:
+    """Slugify a subsystem name once; every node of a subsystem reuses it"""
+    return subsystem_name.lower().translate(_SUBSYS_TRANS)
+
+@functools.lru_cache(maxsize=None)
+def _req_stmt_prefix(req_type: str, subsystem_name: str) -> str:
+    """Shared statement prefix for all requirements of one subsystem"""
+    return f"{req_type} requirement for {subsystem_name}: "
+
+@functools.lru_cache(maxsize=None)
+def _contract_stmt(contract_type: str, subsystem_name: str) -> str:
+    """Contract statements are fully determined by type and subsystem"""
+    return (f"{contract_type.upper()} contract for {subsystem_name}. "
+            "MUST include: versioning, error taxonomy, timeouts, idempotency.")
+
 def generate_node_id(node_type: str, subsystem_name: str, item_name: str = None) -> str:
     """Generate a node ID following the pattern type:slug"""
-    slug_base = subsystem_name.lower().replace(" ", "-").replace("/", "-").replace("&", "-")
+    slug_base = _subsys_slug(subsystem_name)
     if item_name:
-        item_slug = item_name.lower().replace(" ", "-").replace("'", "").replace(".", "")
+        item_slug = item_name.lower().translate(_ITEM_TRANS)
         return f"{node_type}:{slug_base}-{item_slug}"
     return f"{node_type}:{slug_base}"
 
+# Fixed-shape prototypes the factories copy instead of rebuilding the
+# full dict literal per node. Empty collections that this script never
+# mutates are shared tuples (still serialized as []); only fields that
+# are appended to get a fresh list per node.
+_SCENARIO_PROTO = {
+    "id": None,
+    "type": "Scenario",
+    "stmt": None,
+    "status": "Open",
+    "requirements": None,  # fresh list per node; populated later
+    "tests": (),
+    "acceptance": (),
+    "checklist": (),
+    "evidence": (),
+    "unaccounted": (),
+    "updated_at": _NOW_ISO
+}
+
+_REQUIREMENT_PROTO = {
+    "id": None,
+    "type": "Requirement",
+    "stmt": None,
+    "status": "Open",
+    "change_specs": (),
+    "contracts": (),
+    "components": (),
+    "checklist": (),
+    "evidence": (),
+    "unaccounted": (),
+    "updated_at": _NOW_ISO
+}
+
+_COMPONENT_PROTO = {
+    "id": None,
+    "type": "Component",
+    "stmt": None,
+    "status": "Open",
+    "checklist": (),
+    "evidence": (),
+    "unaccounted": (),
+    "updated_at": _NOW_ISO
+}
+
+# Interned so every contract shares one string object per checklist
+# entry; strings with spaces are not auto-interned by CPython
+_CONTRACT_CHECKLIST = tuple(sys.intern(_s) for _s in (
+    "authZ defined",
+    "rate_limit defined",
+    "versioning defined",
+    "error taxonomy defined",
+    "idempotency defined",
+    "timeouts defined",
+    "observability defined"
+))
+
+_TRACES_TO = sys.intern("traces_to")
+
+_CONTRACT_PROTO = {
+    "id": None,
+    "type": "Contract",
+    "stmt": None,
+    "status": "Open",
+    "contract_type": None,
+    "versioning": "semver:minor",  # Default per knobs
+    "error_taxonomy": (),
+    "timeouts": None,  # fresh dict per node
+    "idempotency": "required",
+    "checklist": _CONTRACT_CHECKLIST,
+    "evidence": (),
+    "unaccounted": (),
+    "updated_at": _NOW_ISO
+}
+
 def create_scenario_node(subsystem: str, scenario_stmt: str, subsystem_data: Dict) -> Dict:
     """Create a Scenario node"""
-    scenario_id = generate_node_id("scenario", subsystem, scenario_stmt[:30])
-
-    return {
-        "id": scenario_id,
-        "type": "Scenario",
-        "stmt": f"{scenario_stmt} ({subsystem})",
-        "status": "Open",
-        "requirements": [],  # Will be populated
-        "tests": [],
-        "acceptance": [],
-        "checklist": [],
-        "evidence": [],
-        "unaccounted": [],
-        "updated_at": datetime.now(timezone.utc).isoformat()
-    }
+    node = _SCENARIO_PROTO.copy()
+    node["id"] = generate_node_id("scenario", subsystem, scenario_stmt[:30])
+    node["stmt"] = f"{scenario_stmt} ({subsystem})"
+    node["requirements"] = []  # Will be populated
+    return node
 
 def create_requirement_node(subsystem: str, req_type: str, req_stmt: str) -> Dict:
     """Create a Requirement node"""
-    req_id = generate_node_id("req", subsystem, f"{req_type}-{req_stmt[:20]}")
-
-    return {
-        "id": req_id,
-        "type": "Requirement",
-        "stmt": f"{req_type} requirement for {subsystem}: {req_stmt}",
-        "status": "Open",
-        "change_specs": [],
-        "contracts": [],
-        "components": [],
-        "checklist": [],
-        "evidence": [],
-        "unaccounted": [],
-        "updated_at": datetime.now(timezone.utc).isoformat()
-    }
+    node = _REQUIREMENT_PROTO.copy()
+    node["id"] = generate_node_id("req", subsystem, f"{req_type}-{req_stmt[:20]}")
+    node["stmt"] = _req_stmt_prefix(req_type, subsystem) + req_stmt
+    return node
 
 def create_component_node(subsystem: str, component_name: str) -> Dict:
     """Create a Component node"""
-    component_id = generate_node_id("component", subsystem, component_name.lower().replace(" ", "-"))
-
-    return {
-        "id": component_id,
-        "type": "Component",
-        "stmt": f"{component_name} for {subsystem}",
-        "status": "Open",
-        "checklist": [],
-        "evidence": [],
-        "unaccounted": [],
-        "updated_at": datetime.now(timezone.utc).isoformat()
-    }
+    node = _COMPONENT_PROTO.copy()
+    node["id"] = generate_node_id("component", subsystem, component_name.lower().replace(" ", "-"))
+    node["stmt"] = f"{component_name} for {subsystem}"
+    return node
 
 def create_contract_node(subsystem: str, contract_type: str) -> Dict:
     """Create a Contract node"""
-    contract_id = generate_node_id(f"contract:{contract_type}", subsystem, "")
-    contract_id = contract_id.replace("contract:contract:", "contract:")
+    contract_id = f"contract:{contract_type}:{_subsys_slug(subsystem)}"
 
+    node = _CONTRACT_PROTO.copy()
+    node["id"] = contract_id
     # Core blueprint contracts need: versioning, error taxonomy, timeouts, idempotency
-    stmt = f"{contract_type.upper()} contract for {subsystem}. MUST include: versioning, error taxonomy, timeouts, idempotency."
-
-    return {
-        "id": contract_id,
-        "type": "Contract",
-        "stmt": stmt,
-        "status": "Open",
-        "contract_type": contract_type,
-        "versioning": "semver:minor",  # Default per knobs
-        "error_taxonomy": [],
-        "timeouts": {},
-        "idempotency": "required",
-        "checklist": [
-            "authZ defined",
-            "rate_limit defined",
-            "versioning defined",
-            "error taxonomy defined",
-            "idempotency defined",
-            "timeouts defined",
-            "observability defined"
-        ],
-        "evidence": [],
-        "unaccounted": [],
-        "updated_at": datetime.now(timezone.utc).isoformat()
-    }
+    node["stmt"] = _contract_stmt(contract_type, subsystem)
+    node["contract_type"] = contract_type
+    node["timeouts"] = {}
+    return node
 
 def generate_core_blueprint_nodes(plan_dir: Path):
-    """Generate all Core Blueprint nodes"""
-    nodes = {}
-    edges = []
-
-    for subsystem_name, subsystem_data in CORE_BLUEPRINT_SUBSYSTEMS.items():
-        print(f"\nGenerating nodes for: {subsystem_name}")
-
-        # Create Scenario nodes
-        scenarios = []
-        for scenario_stmt in subsystem_data["scenarios"]:
-            scenario = create_scenario_node(subsystem_name, scenario_stmt, subsystem_data)
+    """Generate all Core Blueprint nodes, streaming edges to disk"""
+    # Accumulated as a list: every insert used to pay a dict hash+probe,
+    # but the only id lookup was on a node we already hold a reference to
+    nodes = []
+    # Edges are serialized as they are created; the byte lines are
+    # handed to the kernel in one writelines call at the end instead of
+    # a Python-level write per edge
+    edge_lines: List[bytes] = []
+
+    with (plan_dir / "edges.ndjson").open("ab") as edges_fp:
+        # Scenarios plus their two requirements, one flat pass
+        last_idx = -1
+        for owner_idx, scenario_stmt in zip(_SCENARIO_OWNER_IDX, _SCENARIO_STMTS):
+            if owner_idx != last_idx:
+                print(f"\nGenerating nodes for: {_SUBSYS_NAMES[owner_idx]}")
+                last_idx = owner_idx
+            subsystem_name = _SUBSYS_NAMES[owner_idx]
+
+            scenario = create_scenario_node(subsystem_name, scenario_stmt, _SUBSYS_DATA[owner_idx])
             scenario_id = scenario["id"]
-            nodes[scenario_id] = scenario
-            scenarios.append(scenario_id)
-
-        # Create Requirement nodes (functional and non-functional per scenario)
-        for scenario_id in scenarios:
-            scenario_node = nodes[scenario_id]
+            nodes.append(scenario)
 
-            # Functional requirement
+            # Functional and non-functional requirement; each scenario
+            # gets exactly two, so the requirements list and the edge
+            # pair are built in one shot instead of growing appends
             func_req = create_requirement_node(
                 subsystem_name,
                 "functional",
-                scenario_node["stmt"]
+                scenario["stmt"]
             )
-            func_req_id = func_req["id"]
-            nodes[func_req_id] = func_req
-            scenario_node["requirements"].append(func_req_id)
-            edges.append({
-                "from": scenario_node["id"],
-                "to": func_req_id,
-                "type": "traces_to"
-            })
-
-            # Non-functional requirement
             nonfunc_req = create_requirement_node(
                 subsystem_name,
                 "non-functional",
-                scenario_node["stmt"]
+                scenario["stmt"]
             )
+            func_req_id = func_req["id"]
             nonfunc_req_id = nonfunc_req["id"]
-            nodes[nonfunc_req_id] = nonfunc_req
-            scenario_node["requirements"].append(nonfunc_req_id)
-            edges.append({
-                "from": scenario_node["id"],
-                "to": nonfunc_req_id,
-                "type": "traces_to"
-            })
-
-        # Create Component nodes
-        for component_name in subsystem_data["core_components"]:
-            component = create_component_node(subsystem_name, component_name)
-            component_id = component["id"]
-            nodes[component_id] = component
-
-        # Create Contract nodes (API, Data, Event, Policy as needed)
-        contract_types = ["api", "data"]
-        if "Notifications" in subsystem_name or "Analytics" in subsystem_name:
-            contract_types.append("event")
-        if "Security" in subsystem_name or "Policy" in subsystem_name:
-            contract_types.append("policy")
-
-        for contract_type in contract_types:
-            contract = create_contract_node(subsystem_name, contract_type)
-            contract_id = contract["id"]
-            nodes[contract_id] = contract
-
-    return nodes, edges
-
-def save_nodes(nodes: Dict, edges: List, plan_dir: Path):
+            nodes.append(func_req)
+            nodes.append(nonfunc_req)
+            scenario["requirements"] = [func_req_id, nonfunc_req_id]
+            edge_lines.extend((
+                _dumps_compact_bytes({
+                    "from": scenario_id,
+                    "to": func_req_id,
+                    "type": _TRACES_TO
+                }) + b"\n",
+                _dumps_compact_bytes({
+                    "from": scenario_id,
+                    "to": nonfunc_req_id,
+                    "type": _TRACES_TO
+                }) + b"\n"
+            ))
+
+        # Component nodes
+        for owner_idx, component_name in zip(_COMPONENT_OWNER_IDX, _COMPONENT_NAMES):
+            component = create_component_node(_SUBSYS_NAMES[owner_idx], component_name)
+            nodes.append(component)
+
+        # Contract nodes; the event/policy expansion was precomputed at
+        # import into _CONTRACT_TYPES
+        for owner_idx, contract_type in zip(_CONTRACT_OWNER_IDX, _CONTRACT_TYPES):
+            contract = create_contract_node(_SUBSYS_NAMES[owner_idx], contract_type)
+            nodes.append(contract)
+
+        edges_fp.writelines(edge_lines)
+
+    return nodes, len(edge_lines)
+
+def save_nodes(nodes: List[Dict], plan_dir: Path):
     """Save nodes to filesystem following plan-fixed structure"""
     nodes_dir = plan_dir / "nodes"
 
-    # Create type directories if needed
-    for node in nodes.values():
-        node_type = node["type"]
-        type_dir = nodes_dir / node_type
-        type_dir.mkdir(parents=True, exist_ok=True)
-
-    # Save each node
-    for node_id, node in nodes.items():
+    if NDJSON_OUTPUT:
+        # Sharded mode: hundreds of tiny files collapse into one
+        # streamed NDJSON file per node type
+        nodes_dir.mkdir(parents=True, exist_ok=True)
+        by_type: Dict[str, List[Dict]] = {}
+        for node in nodes:
+            by_type.setdefault(node["type"], []).append(node)
+        for node_type, type_nodes in by_type.items():
+            shard = nodes_dir / f"{node_type}.ndjson"
+            with shard.open("wb") as f:
+                f.writelines(_dumps_compact_bytes(n) + b"\n" for n in type_nodes)
+        print(f"\nSaved {len(nodes)} nodes in {len(by_type)} NDJSON shards")
+        return
+
+    # Create each type directory once instead of a mkdir per node
+    for node_type in {node["type"] for node in nodes}:
+        (nodes_dir / node_type).mkdir(parents=True, exist_ok=True)
+
+    # Serialize everything first, then write; each file is independent
+    # and the GIL is released inside open/write, so a thread pool
+    # overlaps the per-file I/O latency
+    items = []
+    for node in nodes:
+        node_id = node["id"]
         node_type = node["type"]
         # Replace colons with dashes and clean up filename
-        safe_filename = node_id.replace(':', '-').replace('/', '-').replace('&', '-')
+        safe_filename = node_id.translate(_FILENAME_TRANS)
         node_file = nodes_dir / node_type / f"{safe_filename}.json"
-
-        with open(node_file, 'w') as f:
-            json.dump(node, f, indent=2)
-
-    # Append edges to edges.ndjson
-    edges_file = plan_dir / "edges.ndjson"
-    with open(edges_file, 'a') as f:
-        for edge in edges:
-            f.write(json.dumps(edge) + "\n")
-
-    print(f"\nSaved {len(nodes)} nodes and {len(edges)} edges")
+        items.append((node_file, _dumps_node_bytes(node)))
+
+    def _write(item):
+        # Each payload is one pre-serialized blob, so an unbuffered
+        # binary handle skips the BufferedWriter allocation and copy
+        # that Path.write_bytes would pay per file
+        path, payload = item
+        with open(path, 'wb', buffering=0) as f:
+            f.write(payload)
+
+    # The pool only pays off past a few hundred files
+    if len(items) >= 200:
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as pool:
+            list(pool.map(_write, items))
+    else:
+        for item in items:
+            _write(item)
+
+    print(f"\nSaved {len(nodes)} nodes")
 
 def main():
     """Main entry point"""
+    global NDJSON_OUTPUT
+    if "--ndjson" in sys.argv:
+        NDJSON_OUTPUT = True
+
     plan_dir = Path("plan-fixed")
 
     if not plan_dir.exists():
@@ -391,11 +534,11 @@ def main():
     print("Following how-to-plan.md §2.1 methodology")
     print("=" * 80)
 
-    nodes, edges = generate_core_blueprint_nodes(plan_dir)
+    nodes, edge_count = generate_core_blueprint_nodes(plan_dir)
 
-    print(f"\nGenerated {len(nodes)} nodes and {len(edges)} edges")
+    print(f"\nGenerated {len(nodes)} nodes and {edge_count} edges")
 
-    save_nodes(nodes, edges, plan_dir)
+    save_nodes(nodes, plan_dir)
 
     print("\nCore Blueprint generation complete!")
     print("Next steps:")